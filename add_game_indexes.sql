@@ -0,0 +1,37 @@
+-- =============================================================================
+-- Battle Dinghy - Match Indexes to the Bot's Queries
+-- =============================================================================
+-- The bot looks games up by thread_id and polls the active games on every
+-- cycle. This migration makes sure both are index lookups, and drops
+-- indexes that only duplicate them (each extra index is written on every
+-- game insert).
+--
+-- init_db() in db.py creates idx_games_active on startup; this script is for
+-- databases managed by hand (e.g. the Supabase SQL editor).
+--
+-- Safe to run multiple times (idempotent)
+-- =============================================================================
+
+-- thread_id lookups: the UNIQUE constraint on thread_id already provides an
+-- index (games_thread_id_key), so a second plain index is redundant
+DROP INDEX IF EXISTS public.idx_games_thread_id;
+
+-- Active game polling: index only the active rows. Completed and cancelled
+-- games pile up over time but never match this query.
+CREATE INDEX IF NOT EXISTS idx_games_active
+ON public.games (thread_id) WHERE game_state = 'active';
+
+-- A full index on game_state has only a few distinct values and is
+-- superseded by the partial index above
+DROP INDEX IF EXISTS public.idx_games_game_state;
+
+-- =============================================================================
+-- VERIFICATION
+-- =============================================================================
+-- Run this query after executing the script to list the indexes on games:
+--
+-- SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'games';
+--
+-- Expected: games_pkey, games_thread_id_key, idx_games_active and
+-- idx_games_created_at
+-- =============================================================================
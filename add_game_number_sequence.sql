@@ -0,0 +1,39 @@
+-- =============================================================================
+-- Battle Dinghy - Assign game_number From a Sequence
+-- =============================================================================
+-- This migration lets Postgres assign game_number in the INSERT itself.
+-- Previously the bot read the highest game_number before every new game,
+-- which cost an extra query and let two concurrent games get the same number.
+--
+-- init_db() in db.py applies the same change on startup; this script is for
+-- databases managed by hand (e.g. the Supabase SQL editor).
+--
+-- Safe to run multiple times (idempotent)
+-- =============================================================================
+
+-- Create the sequence, starting after the highest existing game number
+DO $$
+BEGIN
+    IF to_regclass('public.games_game_number_seq') IS NULL THEN
+        CREATE SEQUENCE public.games_game_number_seq;
+        PERFORM setval('public.games_game_number_seq',
+                       COALESCE((SELECT MAX(game_number) FROM public.games), 0) + 1,
+                       false);
+    END IF;
+END $$;
+
+-- New games take their number from the sequence
+ALTER TABLE public.games
+ALTER COLUMN game_number SET DEFAULT nextval('public.games_game_number_seq');
+
+-- =============================================================================
+-- VERIFICATION
+-- =============================================================================
+-- Run this query after executing the script to verify the default was set:
+--
+-- SELECT column_default
+-- FROM information_schema.columns
+-- WHERE table_name = 'games' AND column_name = 'game_number';
+--
+-- Expected output: nextval('games_game_number_seq'::regclass)
+-- =============================================================================
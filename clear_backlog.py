@@ -3,7 +3,9 @@ Script to mark backlogged challenge tweets as processed.
 This prevents the bot from reprocessing old challenges that caused rate limit issues.
 """
 
-from db import mark_tweet_processed
+import sys
+
+from db import mark_tweets_processed
 
 # Tweet IDs from the logs that caused the rate limit loop
 backlogged_tweets = [
@@ -23,9 +25,11 @@ backlogged_tweets = [
 if __name__ == "__main__":
     print("Marking backlogged tweets as processed...")
 
-    for tweet_id in backlogged_tweets:
-        mark_tweet_processed(tweet_id)
-        print(f"  Marked {tweet_id} as processed")
+    marked = mark_tweets_processed(backlogged_tweets)
+    if marked is None:
+        print("\n✗ Could not mark the tweets as processed (see the error above)")
+        sys.exit(1)
 
-    print(f"\n✓ Marked {len(backlogged_tweets)} tweets as processed")
+    already_marked = len(backlogged_tweets) - marked
+    print(f"\n✓ Marked {marked} tweets as processed ({already_marked} already were)")
     print("The bot will now skip these tweets on next poll cycle.")
@@ -1,8 +1,11 @@
 import os
-import random
 import json
+from contextlib import contextmanager
+import re
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extensions import connection as PGConnection
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -14,68 +17,259 @@ if not DATABASE_URL:
     print("ERROR: DATABASE_URL not set. Add a PostgreSQL database in Railway.")
     print("Railway auto-injects DATABASE_URL when you add a Postgres database.")
 
-def get_connection():
-    """Get a database connection."""
-    return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
+# Connections are kept open and reused - opening one costs a TCP + TLS +
+# auth handshake, which is far slower than the queries the bot runs
+DB_POOL_MIN_CONNECTIONS = 1
+DB_POOL_MAX_CONNECTIONS = int(os.getenv("DB_POOL_MAX_CONNECTIONS", "5"))
+connection_pool = None
+
+# The hot queries are PREPAREd once per pooled connection, so Postgres
+# parses and plans them once instead of on every call. Set
+# DB_PREPARED_STATEMENTS=0 when connecting through a transaction-mode
+# pooler (e.g. PgBouncer), which doesn't keep prepared statements.
+# They use columns that init_db() adds to older databases, so they are
+# only prepared on connections borrowed after the schema is set up.
+USE_PREPARED_STATEMENTS = os.getenv("DB_PREPARED_STATEMENTS", "1") == "1"
+PREPARED_STATEMENTS = {
+    'get_game_by_thread_id': "SELECT * FROM games WHERE thread_id = %s",
+    'get_game_meta': """
+        SELECT thread_id, game_number, player1_id, player2_id, player1_username,
+               player2_username, turn, game_state, bot_post_count, last_checked_tweet_id
+        FROM games WHERE thread_id = %s
+    """,
+    'get_game_boards': "SELECT player1_board, player2_board FROM games WHERE thread_id = %s",
+    'update_last_checked_tweet_id': "UPDATE games SET last_checked_tweet_id = %s WHERE thread_id = %s",
+    'get_processed_tweet_ids': "SELECT tweet_id FROM processed_tweets WHERE tweet_id = ANY(%s)",
+    'mark_tweet_processed': """
+        INSERT INTO processed_tweets (tweet_id) VALUES (%s)
+        ON CONFLICT (tweet_id) DO NOTHING
+    """,
+    'claim_tweet': """
+        INSERT INTO processed_tweets (tweet_id) VALUES (%s)
+        ON CONFLICT (tweet_id) DO NOTHING
+        RETURNING tweet_id
+    """,
+}
+
+
+def board_to_json(board):
+    """
+    Serialize a board for a JSONB column.
+    Compact separators drop the spaces json.dumps adds by default, making
+    each board about a quarter smaller on the wire.
 
-def init_db():
-    """Create the games and processed_tweets tables if they don't exist."""
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS games (
-            id SERIAL PRIMARY KEY,
-            game_number INTEGER,
-            player1_id TEXT,
-            player2_id TEXT,
-            player1_board JSONB,
-            player2_board JSONB,
-            turn TEXT,
-            game_state TEXT DEFAULT 'active',
-            thread_id TEXT UNIQUE,
-            bot_post_count INTEGER DEFAULT 0,
-            last_checked_tweet_id TEXT,
-            created_at TIMESTAMP DEFAULT NOW()
-        )
-    """)
-    # Table to track processed tweets (survives restarts)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS processed_tweets (
-            tweet_id TEXT PRIMARY KEY,
-            processed_at TIMESTAMP DEFAULT NOW()
+    Args:
+        board: 5x5 grid (list of lists or tuple of tuples)
+
+    Returns:
+        str: JSON text for the board
+    """
+    return json.dumps(board, separators=(',', ':'))
+
+
+# Applied to every connection: TCP keepalives so a connection the cloud
+# provider silently dropped while idle is noticed quickly instead of after
+# a long TCP timeout, and server-side limits so a stuck query or an
+# abandoned transaction can't hold a connection (or locks) indefinitely
+CONNECTION_OPTIONS = {
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    'keepalives_interval': 10,
+    'keepalives_count': 3,
+    'options': '-c statement_timeout=5000 -c idle_in_transaction_session_timeout=10000',
+}
+
+
+class PooledConnection(PGConnection):
+    """psycopg2 connection that remembers whether its statements are prepared."""
+    statements_prepared = False
+
+
+def get_connection_pool():
+    """Get the shared connection pool, creating it on first use."""
+    global connection_pool
+    if connection_pool is None:
+        connection_pool = ThreadedConnectionPool(
+            DB_POOL_MIN_CONNECTIONS,
+            DB_POOL_MAX_CONNECTIONS,
+            DATABASE_URL,
+            connection_factory=PooledConnection,
+            cursor_factory=RealDictCursor,
+            **CONNECTION_OPTIONS
         )
-    """)
+    return connection_pool
+
+
+def prepare_statements(conn):
+    """
+    PREPARE the hot queries on a connection.
+
+    Args:
+        conn: A connection from the pool
+    """
+    cur = conn.cursor()
+    for name, sql in PREPARED_STATEMENTS.items():
+        # PREPARE takes numbered parameters ($1, $2, ...) instead of %s
+        numbers = iter(range(1, sql.count('%s') + 1))
+        cur.execute(f"PREPARE {name} AS {re.sub('%s', lambda _: f'${next(numbers)}', sql)}")
     conn.commit()
     cur.close()
-    conn.close()
-    print("Database initialized successfully")
+    conn.statements_prepared = True
 
-# Initialize database on import
-if DATABASE_URL:
-    try:
-        init_db()
-    except Exception as e:
-        print(f"Error initializing database: {e}")
+
+def execute_prepared(cur, name, params):
+    """
+    Run one of PREPARED_STATEMENTS with the given parameters.
+
+    Args:
+        cur: Cursor from a connection borrowed with get_connection()
+        name: Key in PREPARED_STATEMENTS
+        params: Tuple of query parameters
+    """
+    if USE_PREPARED_STATEMENTS:
+        placeholders = ", ".join(["%s"] * len(params))
+        cur.execute(f"EXECUTE {name} ({placeholders})", params)
+    else:
+        cur.execute(PREPARED_STATEMENTS[name], params)
 
 
-def get_next_game_number():
-    """Get the next game number for a new game."""
+@contextmanager
+def get_connection(read_only=False, prepare=True):
+    """
+    Borrow a database connection from the pool.
+    The connection goes back to the pool when the with-block exits.
+
+    Args:
+        read_only: Run the borrowed connection's transactions READ ONLY
+        prepare: PREPARE the hot queries on the connection if not done yet.
+                 init_db() passes False, since they need the schema to exist.
+    """
+    pool = get_connection_pool()
+    conn = pool.getconn()
     try:
-        conn = get_connection()
+        # Prepared before the READ ONLY flag is applied, so the writes in
+        # PREPARED_STATEMENTS are prepared on every connection too
+        if prepare and USE_PREPARED_STATEMENTS and not conn.statements_prepared:
+            prepare_statements(conn)
+        # Sent as part of BEGIN, so this costs no extra round trip
+        conn.readonly = True if read_only else None
+        yield conn
+    finally:
+        # Drop any transaction left open (reads, or a failed write) so the
+        # next borrower starts clean; broken connections are discarded
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            pass
+        pool.putconn(conn, close=bool(conn.closed))
+
+
+def init_db():
+    """Create the games and processed_tweets tables if they don't exist."""
+    # Nothing is prepared on this connection: PREPARED_STATEMENTS name tables
+    # and columns that may not exist until the statements below have run
+    with get_connection(prepare=False) as conn:
         cur = conn.cursor()
-        cur.execute("SELECT game_number FROM games ORDER BY game_number DESC LIMIT 1")
-        result = cur.fetchone()
+        # Schema changes like SET UNLOGGED rewrite whole tables, which can take
+        # longer than the connection's statement_timeout. SET LOCAL lifts it
+        # for this transaction only.
+        cur.execute("SET LOCAL statement_timeout = 0")
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS games (
+                id SERIAL PRIMARY KEY,
+                game_number INTEGER,
+                player1_id TEXT,
+                player2_id TEXT,
+                player1_username TEXT,
+                player2_username TEXT,
+                player1_board JSONB,
+                player2_board JSONB,
+                turn TEXT,
+                game_state TEXT DEFAULT 'active',
+                thread_id TEXT UNIQUE,
+                bot_post_count INTEGER DEFAULT 0,
+                last_checked_tweet_id TEXT,
+                created_at TIMESTAMP DEFAULT NOW()
+            )
+        """)
+        # Game numbers come from a sequence so inserts don't need a prior SELECT.
+        # When first created, start it after the highest existing game number.
+        cur.execute("SELECT to_regclass('games_game_number_seq') IS NOT NULL AS seq_exists")
+        if not cur.fetchone()['seq_exists']:
+            cur.execute("CREATE SEQUENCE games_game_number_seq")
+            cur.execute("""
+                SELECT setval('games_game_number_seq', COALESCE(MAX(game_number), 0) + 1, false)
+                FROM games
+            """)
+        cur.execute("ALTER TABLE games ALTER COLUMN game_number SET DEFAULT nextval('games_game_number_seq')")
+        # Add columns introduced after the table was first created
+        cur.execute("ALTER TABLE games ADD COLUMN IF NOT EXISTS player1_username TEXT")
+        cur.execute("ALTER TABLE games ADD COLUMN IF NOT EXISTS player2_username TEXT")
+        # thread_id lookups use the UNIQUE constraint's index. get_active_games
+        # filters on game_state, so index just the active rows - completed
+        # games pile up over time but never match that query.
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_games_active
+            ON games (thread_id) WHERE game_state = 'active'
+        """)
+        # Table to track processed tweets (survives restarts). It's a 24h
+        # dedupe cache written on every handled tweet, so it's UNLOGGED to
+        # skip the WAL: a database crash empties it, but the bot_state and
+        # last_checked_tweet_id checkpoints still keep old tweets from
+        # being picked up again.
+        cur.execute("""
+            CREATE UNLOGGED TABLE IF NOT EXISTS processed_tweets (
+                tweet_id TEXT PRIMARY KEY,
+                processed_at TIMESTAMP DEFAULT NOW()
+            )
+        """)
+        cur.execute("SELECT relpersistence FROM pg_class WHERE oid = 'processed_tweets'::regclass")
+        if cur.fetchone()['relpersistence'] != 'u':
+            cur.execute("ALTER TABLE processed_tweets SET UNLOGGED")
+        # cleanup_old_processed_tweets deletes by age - without this index
+        # every hourly cleanup scans the whole table
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_processed_tweets_processed_at
+            ON processed_tweets (processed_at)
+        """)
+        # Notify listeners whenever the set of active games may have changed
+        # (new game, replaced game, completed or cancelled game), so the bot
+        # can skip re-reading the active games on polls where nothing changed
+        cur.execute("""
+            CREATE OR REPLACE FUNCTION notify_games_changed() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                PERFORM pg_notify('games_changed', '');
+                RETURN NULL;
+            END
+            $$
+        """)
+        cur.execute("DROP TRIGGER IF EXISTS games_changed ON games")
+        cur.execute("""
+            CREATE TRIGGER games_changed
+            AFTER INSERT OR DELETE OR UPDATE OF game_state ON games
+            FOR EACH STATEMENT EXECUTE PROCEDURE notify_games_changed()
+        """)
+        # Key/value table for bot checkpoints (e.g. last seen challenge tweet)
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS bot_state (
+                key TEXT PRIMARY KEY,
+                value TEXT,
+                updated_at TIMESTAMP DEFAULT NOW()
+            )
+        """)
+        conn.commit()
+        # Statements prepared before the ALTERs above would fail with "cached
+        # plan must not change result type"; prepare them again on next use
+        if conn.statements_prepared:
+            cur.execute("DEALLOCATE ALL")
+            conn.statements_prepared = False
         cur.close()
-        conn.close()
-        if result:
-            return result['game_number'] + 1
-        return 1
-    except Exception as e:
-        print(f"Error getting next game number: {e}")
-        return 1
+    print("Database initialized successfully")
 
 
-def create_game(player1_id, player2_id, player1_board, player2_board, thread_id):
+def create_game(player1_id, player2_id, player1_board, player2_board, thread_id,
+                player1_username=None, player2_username=None):
     """
     Create a new game in the database.
 
@@ -85,51 +279,63 @@ def create_game(player1_id, player2_id, player1_board, player2_board, thread_id)
         player1_board: Player 1's secret ship board (5x5 grid)
         player2_board: Player 2's secret ship board (5x5 grid)
         thread_id: Twitter thread/conversation ID for the game
+        player1_username: Optional username of player 1 (saves lookups every turn)
+        player2_username: Optional username of player 2 (saves lookups every turn)
 
     Returns:
-        str: The thread_id of the newly created game
+        dict: The newly created game row. Its bot_post_count already counts
+              the bot's opening post, so the caller can use it as the post number.
 
     Raises:
         Exception: If game creation fails for any reason
     """
-    game_number = get_next_game_number()
-    first_turn = random.choice(['player1', 'player2'])
-
-    conn = get_connection()
-    cur = conn.cursor()
-    try:
-        # First, delete ANY existing game with this thread_id (active, cancelled, or completed)
-        # This allows reusing a thread for a new game
-        cur.execute("""
-            DELETE FROM games
-            WHERE thread_id = %s
-        """, (thread_id,))
-        deleted = cur.rowcount
-        if deleted > 0:
-            print(f"Deleted {deleted} old game(s) for thread {thread_id}")
-
-        # Now insert the new game - should never conflict since we just deleted
-        cur.execute("""
-            INSERT INTO games (game_number, player1_id, player2_id, player1_board, player2_board, turn, game_state, thread_id, bot_post_count)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """, (game_number, player1_id, player2_id, json.dumps(player1_board), json.dumps(player2_board), first_turn, 'active', thread_id, 0))
-
-        result = cur.fetchone()
-        if not result:
-            raise Exception(f"Failed to insert game - no row returned")
-
-        conn.commit()
-        print(f"Successfully created game #{game_number} with thread_id {thread_id} (db id: {result['id']})")
-    except Exception as e:
-        conn.rollback()
-        print(f"Error creating game: {e}")
-        raise
-    finally:
-        cur.close()
-        conn.close()
-
-    return thread_id
+    with get_connection() as conn:
+        cur = conn.cursor()
+        try:
+            # One statement creates the game. If the thread already has a game
+            # (active, cancelled, or completed) it is replaced, which allows
+            # reusing a thread for a new game. Postgres picks who goes first.
+            # xmax is non-zero only on a row that existed before this statement.
+            cur.execute("""
+                INSERT INTO games (player1_id, player2_id, player1_username, player2_username,
+                                   player1_board, player2_board, turn, game_state, thread_id, bot_post_count)
+                VALUES (%s, %s, %s, %s, %s, %s,
+                        CASE WHEN random() < 0.5 THEN 'player1' ELSE 'player2' END,
+                        'active', %s, 1)
+                ON CONFLICT (thread_id) DO UPDATE SET
+                    game_number = EXCLUDED.game_number,
+                    player1_id = EXCLUDED.player1_id,
+                    player2_id = EXCLUDED.player2_id,
+                    player1_username = EXCLUDED.player1_username,
+                    player2_username = EXCLUDED.player2_username,
+                    player1_board = EXCLUDED.player1_board,
+                    player2_board = EXCLUDED.player2_board,
+                    turn = EXCLUDED.turn,
+                    game_state = EXCLUDED.game_state,
+                    bot_post_count = EXCLUDED.bot_post_count,
+                    last_checked_tweet_id = NULL,
+                    created_at = NOW()
+                RETURNING *, xmax <> 0 AS replaced_old_game
+            """, (player1_id, player2_id, player1_username, player2_username,
+                  board_to_json(player1_board), board_to_json(player2_board), thread_id))
+
+            result = cur.fetchone()
+            if not result:
+                raise Exception(f"Failed to insert game - no row returned")
+
+            conn.commit()
+            result = dict(result)
+            if result.pop('replaced_old_game'):
+                print(f"Replaced old game for thread {thread_id}")
+            print(f"Successfully created game #{result['game_number']} with thread_id {thread_id} (db id: {result['id']})")
+        except Exception as e:
+            conn.rollback()
+            print(f"Error creating game: {e}")
+            raise
+        finally:
+            cur.close()
+
+    return result
 
 
 def get_game_state(game_id):
@@ -142,12 +348,11 @@ def get_game_state(game_id):
     Returns:
         dict: The complete game state row from the database
     """
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM games WHERE id = %s", (game_id,))
-    result = cur.fetchone()
-    cur.close()
-    conn.close()
+    with get_connection(read_only=True) as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT * FROM games WHERE id = %s", (game_id,))
+        result = cur.fetchone()
+        cur.close()
     return dict(result) if result else None
 
 
@@ -161,16 +366,82 @@ def get_game_by_thread_id(thread_id):
     Returns:
         dict: The complete game state row from the database, or None if not found
     """
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM games WHERE thread_id = %s", (thread_id,))
-    result = cur.fetchone()
-    cur.close()
-    conn.close()
+    with get_connection(read_only=True) as conn:
+        cur = conn.cursor()
+        execute_prepared(cur, 'get_game_by_thread_id', (thread_id,))
+        result = cur.fetchone()
+        cur.close()
+    return dict(result) if result else None
+
+
+def get_game_meta(thread_id):
+    """
+    Retrieve a game's players, turn and state without its boards.
+
+    Enough for the turn and game-state checks, which don't need the two
+    JSONB boards decoded. Load those with get_game_boards() when a shot is
+    actually taken.
+
+    Args:
+        thread_id: The Twitter thread/conversation ID to search for
+
+    Returns:
+        dict: The game row without board columns, or None if not found
+    """
+    with get_connection(read_only=True) as conn:
+        cur = conn.cursor()
+        execute_prepared(cur, 'get_game_meta', (thread_id,))
+        result = cur.fetchone()
+        cur.close()
+    return dict(result) if result else None
+
+
+def get_game_boards(thread_id):
+    """
+    Retrieve just the two boards of a game.
+
+    Args:
+        thread_id: The Twitter thread/conversation ID to search for
+
+    Returns:
+        dict: player1_board and player2_board, or None if not found
+    """
+    with get_connection(read_only=True) as conn:
+        cur = conn.cursor()
+        execute_prepared(cur, 'get_game_boards', (thread_id,))
+        result = cur.fetchone()
+        cur.close()
     return dict(result) if result else None
 
 
-def update_game_after_shot(thread_id, board_field, updated_board, new_turn_or_state, expected_turn=None):
+def get_games_by_thread_ids(thread_ids):
+    """
+    Retrieve several games by their Twitter thread IDs in one query.
+
+    Args:
+        thread_ids: Iterable of thread/conversation IDs to search for
+
+    Returns:
+        dict: Mapping of thread_id to its complete game row (missing threads are left out)
+    """
+    thread_ids = [str(thread_id) for thread_id in thread_ids]
+    if not thread_ids:
+        return {}
+
+    try:
+        with get_connection(read_only=True) as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT * FROM games WHERE thread_id = ANY(%s)", (thread_ids,))
+            results = cur.fetchall()
+            cur.close()
+        return {r['thread_id']: dict(r) for r in results}
+    except Exception as e:
+        print(f"Error getting games by thread IDs: {e}")
+        return {}
+
+
+def update_game_after_shot(thread_id, board_field, updated_board, new_turn_or_state, expected_turn=None,
+                           shooter_id=None, posts_to_reserve=0):
     """
     Update the game state after a shot has been taken.
     Includes turn validation to prevent race conditions.
@@ -181,94 +452,150 @@ def update_game_after_shot(thread_id, board_field, updated_board, new_turn_or_st
         updated_board: The updated board state (6x6 grid)
         new_turn_or_state: Either 'player1', 'player2', or 'completed'
         expected_turn: Optional - the turn we expect (for race condition detection)
+        shooter_id: Optional - ID of the player firing; the update only applies
+                    if it is currently that player's turn
+        posts_to_reserve: Optional - bump bot_post_count by this much in the same
+                          statement (saves a separate increment_bot_post_count call)
 
     Returns:
-        dict: The updated game state, or None if update failed
+        dict: The updated game state (bot_post_count is the last reserved post
+              number), or None if update failed
     """
     try:
-        # If expected_turn provided, verify it matches current state
+        # If expected_turn provided, only update while the game is still active
+        # and on that turn - checked in the same statement so there's no
+        # window between reading the turn and writing the shot
+        where_clause = "thread_id = %s"
+        where_params = (thread_id,)
+        if expected_turn or shooter_id:
+            where_clause += " AND game_state = 'active'"
         if expected_turn:
-            current_game = get_game_by_thread_id(thread_id)
-            if not current_game:
-                return None
-            if current_game.get('turn') != expected_turn:
-                print(f"Race condition detected: expected {expected_turn}, got {current_game.get('turn')}")
-                return None
-            if current_game.get('game_state') != 'active':
-                print(f"Game no longer active")
-                return None
-
-        conn = get_connection()
-        cur = conn.cursor()
+            where_clause += " AND turn = %s"
+            where_params += (expected_turn,)
+        if shooter_id:
+            where_clause += " AND CASE turn WHEN 'player1' THEN player1_id WHEN 'player2' THEN player2_id END = %s"
+            where_params += (str(shooter_id),)
 
-        if new_turn_or_state == 'completed':
-            cur.execute(f"""
-                UPDATE games SET {board_field} = %s, game_state = 'completed'
-                WHERE thread_id = %s RETURNING *
-            """, (json.dumps(updated_board), thread_id))
-        else:
-            cur.execute(f"""
-                UPDATE games SET {board_field} = %s, turn = %s
-                WHERE thread_id = %s RETURNING *
-            """, (json.dumps(updated_board), new_turn_or_state, thread_id))
+        with get_connection() as conn:
+            cur = conn.cursor()
 
-        result = cur.fetchone()
-        conn.commit()
-        cur.close()
-        conn.close()
+            # A finished game keeps its last turn; otherwise hand the turn over
+            if new_turn_or_state == 'completed':
+                set_clause = "game_state = %s"
+            else:
+                set_clause = "turn = %s"
+
+            cur.execute(f"""
+                UPDATE games SET {board_field} = %s, {set_clause},
+                                 bot_post_count = bot_post_count + %s
+                WHERE {where_clause} RETURNING *
+            """, (board_to_json(updated_board), new_turn_or_state, posts_to_reserve) + where_params)
+
+            result = cur.fetchone()
+            conn.commit()
+            cur.close()
+        if not result and (expected_turn or shooter_id):
+            print(f"Race condition detected: game is no longer active on turn {expected_turn} for shooter {shooter_id}")
         return dict(result) if result else None
     except Exception as e:
         print(f"Error updating game after shot: {e}")
         return None
 
 
-def increment_bot_post_count(thread_id):
+def increment_bot_post_count(thread_id, count=1):
     """
     Increment and return the bot post count for a game thread.
 
     Args:
         thread_id: The thread ID of the game
+        count: How many post numbers to reserve (e.g. 2 for a result + prompt pair)
 
     Returns:
-        int: The new post count (for use as post number)
+        int: The new post count (the last reserved post number)
     """
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("""
-            UPDATE games SET bot_post_count = bot_post_count + 1
-            WHERE thread_id = %s RETURNING bot_post_count
-        """, (thread_id,))
-        result = cur.fetchone()
-        conn.commit()
-        cur.close()
-        conn.close()
-        return result['bot_post_count'] if result else 1
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                UPDATE games SET bot_post_count = bot_post_count + %s
+                WHERE thread_id = %s RETURNING bot_post_count
+            """, (count, thread_id))
+            result = cur.fetchone()
+            conn.commit()
+            cur.close()
+        return result['bot_post_count'] if result else count
     except Exception as e:
         print(f"Error incrementing bot post count: {e}")
-        return 1
+        return count
 
 
 def get_active_games():
     """
     Get all active games for monitoring.
 
+    Only the columns needed to poll the game threads are returned - the
+    board columns are left out, since most polls find no fire commands.
+    Use get_game_by_thread_id() for the full game.
+
     Returns:
-        list: List of active game records
+        list: List of active game records (thread_id, player IDs and
+              last_checked_tweet_id)
     """
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM games WHERE game_state = 'active'")
-        results = cur.fetchall()
-        cur.close()
-        conn.close()
+        with get_connection(read_only=True) as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT thread_id, player1_id, player2_id, last_checked_tweet_id
+                FROM games WHERE game_state = 'active'
+            """)
+            results = cur.fetchall()
+            cur.close()
         return [dict(r) for r in results] if results else []
     except Exception as e:
         print(f"Error getting active games: {e}")
         return []
 
 
+def listen_for_game_changes():
+    """
+    Open a dedicated connection that LISTENs for changes to the active games.
+    It stays outside the pool, since notifications arrive on the connection
+    that issued the LISTEN.
+
+    Returns:
+        connection: The listening connection, or None if it couldn't be opened
+    """
+    try:
+        conn = psycopg2.connect(DATABASE_URL, **CONNECTION_OPTIONS)
+        conn.autocommit = True
+        cur = conn.cursor()
+        cur.execute("LISTEN games_changed")
+        cur.close()
+        return conn
+    except Exception as e:
+        print(f"Error listening for game changes: {e}")
+        return None
+
+
+def has_game_changes(listen_conn):
+    """
+    Check whether any game changes were notified since the last check.
+
+    Args:
+        listen_conn: Connection from listen_for_game_changes()
+
+    Returns:
+        bool: True if the active games may have changed
+
+    Raises:
+        psycopg2.Error: If the listening connection was lost
+    """
+    listen_conn.poll()
+    changed = bool(listen_conn.notifies)
+    listen_conn.notifies.clear()
+    return changed
+
+
 def update_last_checked_tweet_id(thread_id, tweet_id):
     """
     Update the last checked tweet ID for a game thread.
@@ -279,33 +606,58 @@ def update_last_checked_tweet_id(thread_id, tweet_id):
         tweet_id: The last processed tweet ID
     """
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("""
-            UPDATE games SET last_checked_tweet_id = %s WHERE thread_id = %s
-        """, (tweet_id, thread_id))
-        conn.commit()
-        cur.close()
-        conn.close()
+        with get_connection() as conn:
+            cur = conn.cursor()
+            execute_prepared(cur, 'update_last_checked_tweet_id', (tweet_id, thread_id))
+            conn.commit()
+            cur.close()
     except Exception as e:
         print(f"Error updating last_checked_tweet_id: {e}")
 
 
+def update_player_usernames(thread_id, player1_username, player2_username):
+    """
+    Store both players' usernames for a game thread.
+    Used to backfill games created before usernames were stored.
+
+    Args:
+        thread_id: The thread ID of the game
+        player1_username: Username of player 1
+        player2_username: Username of player 2
+    """
+    try:
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                UPDATE games SET player1_username = %s, player2_username = %s WHERE thread_id = %s
+            """, (player1_username, player2_username, thread_id))
+            conn.commit()
+            cur.close()
+    except Exception as e:
+        print(f"Error updating player usernames: {e}")
+
+
 def delete_all_games():
     """
     Delete all games from the database.
     USE WITH CAUTION - for development/testing only.
+
+    Returns:
+        int: Number of games deleted
     """
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("DELETE FROM games")
-        conn.commit()
-        cur.close()
-        conn.close()
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute("DELETE FROM games")
+            # Row count comes back with the DELETE itself - no need to fetch rows to count them
+            deleted = cur.rowcount
+            conn.commit()
+            cur.close()
         print("All games deleted")
+        return deleted
     except Exception as e:
         print(f"Error deleting games: {e}")
+        return 0
 
 
 def is_tweet_processed(tweet_id):
@@ -319,18 +671,43 @@ def is_tweet_processed(tweet_id):
         bool: True if already processed, False otherwise
     """
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("SELECT 1 FROM processed_tweets WHERE tweet_id = %s", (str(tweet_id),))
-        result = cur.fetchone()
-        cur.close()
-        conn.close()
+        with get_connection(read_only=True) as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT 1 FROM processed_tweets WHERE tweet_id = %s", (str(tweet_id),))
+            result = cur.fetchone()
+            cur.close()
         return result is not None
     except Exception as e:
         print(f"Error checking processed tweet: {e}")
         return False
 
 
+def get_processed_tweet_ids(tweet_ids):
+    """
+    Check which of several tweets have already been processed, in one query.
+
+    Args:
+        tweet_ids: Iterable of tweet IDs to check
+
+    Returns:
+        set: The tweet IDs (as strings) that have already been processed
+    """
+    tweet_ids = [str(tweet_id) for tweet_id in tweet_ids]
+    if not tweet_ids:
+        return set()
+
+    try:
+        with get_connection(read_only=True) as conn:
+            cur = conn.cursor()
+            execute_prepared(cur, 'get_processed_tweet_ids', (tweet_ids,))
+            results = cur.fetchall()
+            cur.close()
+        return {r['tweet_id'] for r in results}
+    except Exception as e:
+        print(f"Error checking processed tweets: {e}")
+        return set()
+
+
 def mark_tweet_processed(tweet_id):
     """
     Mark a tweet as processed in the database.
@@ -339,19 +716,68 @@ def mark_tweet_processed(tweet_id):
         tweet_id: The tweet ID to mark as processed
     """
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO processed_tweets (tweet_id) VALUES (%s)
-            ON CONFLICT (tweet_id) DO NOTHING
-        """, (str(tweet_id),))
-        conn.commit()
-        cur.close()
-        conn.close()
+        with get_connection() as conn:
+            cur = conn.cursor()
+            execute_prepared(cur, 'mark_tweet_processed', (str(tweet_id),))
+            conn.commit()
+            cur.close()
     except Exception as e:
         print(f"Error marking tweet as processed: {e}")
 
 
+def claim_tweet(tweet_id):
+    """
+    Mark a tweet as processed, unless it already was.
+    The check and the mark are one statement, so two callers can never
+    both claim the same tweet.
+
+    Args:
+        tweet_id: The tweet ID to claim
+
+    Returns:
+        bool: True if the tweet was newly claimed, False if already processed
+    """
+    try:
+        with get_connection() as conn:
+            cur = conn.cursor()
+            execute_prepared(cur, 'claim_tweet', (str(tweet_id),))
+            result = cur.fetchone()
+            conn.commit()
+            cur.close()
+        return result is not None
+    except Exception as e:
+        print(f"Error claiming tweet: {e}")
+        # Same as a failed mark_tweet_processed: carry on rather than drop the tweet
+        return True
+
+
+def mark_tweets_processed(tweet_ids):
+    """
+    Mark several tweets as processed in a single INSERT.
+
+    Args:
+        tweet_ids: Iterable of tweet IDs to mark as processed
+
+    Returns:
+        int: Number of tweets newly marked (ones already processed aren't
+             counted), or None if the insert failed
+    """
+    try:
+        with get_connection() as conn:
+            cur = conn.cursor()
+            inserted = execute_values(cur, """
+                INSERT INTO processed_tweets (tweet_id) VALUES %s
+                ON CONFLICT (tweet_id) DO NOTHING
+                RETURNING tweet_id
+            """, [(str(tweet_id),) for tweet_id in tweet_ids], fetch=True)
+            conn.commit()
+            cur.close()
+        return len(inserted)
+    except Exception as e:
+        print(f"Error marking tweets as processed: {e}")
+        return None
+
+
 def cleanup_old_processed_tweets(hours=24):
     """
     Remove processed tweet records older than specified hours.
@@ -361,22 +787,67 @@ def cleanup_old_processed_tweets(hours=24):
         hours: Number of hours after which to delete records (default 24)
     """
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("""
-            DELETE FROM processed_tweets
-            WHERE processed_at < NOW() - INTERVAL '%s hours'
-        """, (hours,))
-        deleted = cur.rowcount
-        conn.commit()
-        cur.close()
-        conn.close()
+        with get_connection() as conn:
+            cur = conn.cursor()
+            # A large backlog can take longer than the connection's
+            # statement_timeout to delete; lift it for this transaction only
+            cur.execute("SET LOCAL statement_timeout = 0")
+            cur.execute("""
+                DELETE FROM processed_tweets
+                WHERE processed_at < NOW() - make_interval(hours => %s)
+            """, (int(hours),))
+            deleted = cur.rowcount
+            conn.commit()
+            cur.close()
         if deleted > 0:
             print(f"Cleaned up {deleted} old processed tweet records")
     except Exception as e:
         print(f"Error cleaning up processed tweets: {e}")
 
 
+def get_bot_state(key):
+    """
+    Get a persisted bot checkpoint value.
+
+    Args:
+        key: The state key (e.g. 'last_challenge_tweet_id')
+
+    Returns:
+        str: The stored value, or None if not set
+    """
+    try:
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT value FROM bot_state WHERE key = %s", (key,))
+            result = cur.fetchone()
+            cur.close()
+        return result['value'] if result else None
+    except Exception as e:
+        print(f"Error getting bot state {key}: {e}")
+        return None
+
+
+def set_bot_state(key, value):
+    """
+    Persist a bot checkpoint value so it survives restarts.
+
+    Args:
+        key: The state key (e.g. 'last_challenge_tweet_id')
+        value: The value to store
+    """
+    try:
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                INSERT INTO bot_state (key, value) VALUES (%s, %s)
+                ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()
+            """, (key, str(value)))
+            conn.commit()
+            cur.close()
+    except Exception as e:
+        print(f"Error setting bot state {key}: {e}")
+
+
 def cancel_game_by_thread_id(thread_id):
     """
     Cancel a specific game by its thread_id.
@@ -388,17 +859,16 @@ def cancel_game_by_thread_id(thread_id):
         bool: True if a game was cancelled, False otherwise
     """
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("""
-            UPDATE games SET game_state = 'cancelled'
-            WHERE thread_id = %s AND game_state = 'active'
-            RETURNING thread_id
-        """, (thread_id,))
-        result = cur.fetchone()
-        conn.commit()
-        cur.close()
-        conn.close()
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                UPDATE games SET game_state = 'cancelled'
+                WHERE thread_id = %s AND game_state = 'active'
+                RETURNING thread_id
+            """, (thread_id,))
+            result = cur.fetchone()
+            conn.commit()
+            cur.close()
         if result:
             print(f"Cancelled game in thread {thread_id}")
             return True
@@ -416,18 +886,15 @@ def cancel_all_active_games():
     Returns the number of games cancelled.
     """
     try:
-        conn = get_connection()
-        cur = conn.cursor()
-        cur.execute("""
-            UPDATE games SET game_state = 'cancelled'
-            WHERE game_state = 'active'
-            RETURNING thread_id
-        """)
-        cancelled = cur.fetchall()
-        conn.commit()
-        cur.close()
-        conn.close()
-        count = len(cancelled) if cancelled else 0
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                UPDATE games SET game_state = 'cancelled'
+                WHERE game_state = 'active'
+            """)
+            count = cur.rowcount
+            conn.commit()
+            cur.close()
         print(f"Cancelled {count} active game(s)")
         return count
     except Exception as e:
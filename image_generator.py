@@ -5,9 +5,252 @@ Generates mobile-optimized PNG images for public Battleship games on Twitter
 
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
+import json
 import math
-import tempfile
-import os
+import threading
+
+
+# Miss markers look the same on every board
+MISS_COLOR = (50, 180, 80)
+MISS_OUTLINE_COLOR = (30, 140, 60)
+
+# Ship damage indicator colors
+SHIP_COLOR = (100, 105, 115)
+SHIP_HIT_COLOR = (200, 80, 60)
+SHIP_SUNK_COLOR = (120, 40, 40)
+
+# generate_board_image palettes:
+# (BG_COLOR, WATER_COLOR1, WATER_COLOR2, GRID_LINE_COLOR, ACCENT_COLOR)
+# Player 1's board (BLACK theme) - brightened water by ~20%
+DARK_BOARD_PALETTE = (
+    (12, 12, 18),
+    (25, 55, 110),   # Was (20, 45, 90)
+    (40, 75, 135),   # Was (30, 60, 110)
+    (70, 85, 110),   # Slightly brighter for contrast
+    (70, 130, 200),  # Blue accent
+)
+# Player 2's board (GRAY theme) - brightened water by ~15%
+GRAY_BOARD_PALETTE = (
+    (25, 28, 35),
+    (55, 90, 140),   # Was (45, 75, 120)
+    (70, 110, 165),  # Was (55, 90, 140)
+    (90, 105, 130),  # Slightly brighter for contrast
+    (200, 160, 80),  # Gold accent
+)
+
+
+# Recently rendered board PNGs by image name (least recently used first), so
+# a repeated board - e.g. the blank opening board for the same two players -
+# comes back without drawing or encoding it again. Boards are rendered from
+# a background thread too, hence the lock.
+MAX_RENDERED_IMAGES = 128
+rendered_images = OrderedDict()
+rendered_images_lock = threading.Lock()
+
+
+def _png_buffer(png, name):
+    """Wrap PNG bytes in a named BytesIO, as returned by generate_board_image."""
+    buffer = BytesIO(png)
+    buffer.name = name
+    return buffer
+
+
+def _board_image_name(board, attacker_name, defender_name, theme_color, ships_status):
+    """File name for the PNG of these render inputs (same inputs -> same name)."""
+    key_data = json.dumps([board, attacker_name, defender_name, theme_color, ships_status], sort_keys=True)
+    key = hashlib.blake2b(key_data.encode('utf-8'), digest_size=8).hexdigest()
+    return f"battle_dinghy_{key}.png"
+
+
+def _to_palette(img):
+    """
+    Convert a finished RGB render to a 256-color palette image for encoding.
+
+    A board has a few hundred colors, nearly all of them antialiasing
+    shades, so the palette is visually lossless (well under 1/255 mean
+    error) while the PNG is about half the size and encodes faster.
+    """
+    return img.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+
+
+@lru_cache(maxsize=64)
+def _hex_to_rgb(hex_color):
+    """Parse a '#RRGGBB' color into an (r, g, b) tuple, once per color."""
+    hex_color = hex_color.lstrip('#')
+    return (int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16))
+
+
+@lru_cache(maxsize=32)
+def _font(size):
+    """
+    Arial at the given size, or Pillow's default font if it isn't installed.
+
+    Loaded once per size - opening and parsing the TTF on every render is
+    slower than drawing the board itself.
+    """
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@lru_cache(maxsize=64)
+def _text_mask(text, size):
+    """
+    Text rasterized once as an 'L' mask, for text that's the same on every
+    board (axis labels, ship names, watermark).
+
+    Args:
+        text: The text to render
+        size: Font size, as passed to _font()
+
+    Returns:
+        tuple: (mask, (left, top)) - paste the text color through the mask at
+               the drawing position offset by (left, top)
+    """
+    font = _font(size)
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new('L', (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, (left, top)
+
+
+@lru_cache(maxsize=32)
+def _ship_indicator_sprite(size, hits, is_sunk):
+    """
+    A ship's row of segments showing its damage, on a transparent background.
+
+    There are only a few (size, hits, sunk) states, so each row is drawn
+    once and pasted from then on.
+
+    Args:
+        size: Number of segments (the ship's length)
+        hits: How many segments to mark as hit
+        is_sunk: Whether to draw the whole ship as sunk
+
+    Returns:
+        Image: RGBA sprite (callers must not draw on it)
+    """
+    segment_width = 22   # Increased from 18 for better mobile visibility
+    segment_height = 16  # Increased from 14 for better mobile visibility
+    gap = 3
+
+    sprite = Image.new('RGBA', ((size - 1) * (segment_width + gap) + segment_width + 1, segment_height + 1),
+                       (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    for i in range(size):
+        seg_x = i * (segment_width + gap)
+        if is_sunk:
+            color = SHIP_SUNK_COLOR
+        elif i < hits:
+            color = SHIP_HIT_COLOR
+        else:
+            color = SHIP_COLOR
+
+        # Draw rounded segment
+        draw.rounded_rectangle(
+            [seg_x, 0, seg_x + segment_width, segment_height],
+            radius=3,
+            fill=color,
+            outline=(40, 45, 55) if not is_sunk else (80, 30, 30)
+        )
+
+        # Draw hit marker (X) on damaged segments
+        if i < hits and not is_sunk:
+            draw.line([(seg_x + 4, 3), (seg_x + segment_width - 4, segment_height - 3)],
+                      fill=(255, 255, 255), width=2)
+            draw.line([(seg_x + segment_width - 4, 3), (seg_x + 4, segment_height - 3)],
+                      fill=(255, 255, 255), width=2)
+    return sprite
+
+
+@lru_cache(maxsize=32)
+def _gradient_tile(size, color1, color2):
+    """
+    A size x size square with a vertical gradient from color1 to color2.
+
+    Every cell of a kind (water, ship) has the same colors, so the tile is
+    drawn once and pasted into each cell instead of redrawn line by line.
+    Callers must not draw on the returned image.
+    """
+    # Build a 1-pixel-wide column of the gradient, then let Pillow stretch
+    # it sideways instead of drawing one line per row
+    column = bytearray()
+    for i in range(size):
+        ratio = i / size
+        column += bytes(int(c1 + (c2 - c1) * ratio) for c1, c2 in zip(color1, color2))
+    strip = Image.frombytes('RGB', (1, size), bytes(column))
+    return strip.resize((size, size), Image.NEAREST)
+
+
+@lru_cache(maxsize=8)
+def _explosion_sprite(size):
+    """
+    A size x size explosion burst on a transparent background.
+
+    Every hit cell shows the same burst, so it is drawn once and pasted
+    (using itself as the mask) instead of redrawn for each hit.
+    """
+    sprite = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    center_x = size // 2
+    center_y = size // 2
+
+    # Outer explosion rays (yellow)
+    for angle in range(0, 360, 30):
+        rad = math.radians(angle)
+        x1 = center_x + int(math.cos(rad) * size * 0.4)
+        y1 = center_y + int(math.sin(rad) * size * 0.4)
+        draw.line([(center_x, center_y), (x1, y1)], fill=(255, 200, 0), width=2)
+
+    # Middle burst (orange)
+    draw.ellipse([size//4, size//4, 3*size//4, 3*size//4], fill=(255, 140, 0))
+
+    # Inner core (bright red)
+    draw.ellipse([size//3, size//3, 2*size//3, 2*size//3], fill=(255, 50, 30))
+    return sprite
+
+
+@lru_cache(maxsize=8)
+def _miss_sprite(diameter):
+    """A green miss circle on a transparent background, drawn once per size."""
+    sprite = Image.new('RGBA', (diameter + 1, diameter + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).ellipse([0, 0, diameter, diameter],
+                                   fill=MISS_COLOR, outline=MISS_OUTLINE_COLOR, width=2)
+    return sprite
+
+
+@lru_cache(maxsize=32)
+def _cell_tile(size, color1, color2, marker=None, inset=0):
+    """
+    A complete board cell: gradient background plus an optional marker.
+
+    Boards only have a handful of distinct cells, so each is composed once
+    and every cell of the board is then a single paste.
+
+    Args:
+        size: Width and height of the cell's square in pixels
+        color1: Gradient color at the top
+        color2: Gradient color at the bottom
+        marker: None, 'miss' or 'hit'
+        inset: Gap in pixels between the square's edge and the marker
+
+    Returns:
+        Image: The cell (callers must not draw on it)
+    """
+    if marker is None:
+        return _gradient_tile(size, color1, color2)
+
+    tile = _gradient_tile(size, color1, color2).copy()
+    if marker == 'miss':
+        sprite = _miss_sprite(size - 2 * inset)
+    else:
+        sprite = _explosion_sprite(size - 2 * inset)
+    tile.paste(sprite, (inset, inset), sprite)
+    return tile
 
 
 def generate_board_image(board, attacker_name, defender_name, theme_color='#2C2C2C', ships_status=None):
@@ -25,8 +268,17 @@ def generate_board_image(board, attacker_name, defender_name, theme_color='#2C2C
             {'big': {'hits': 0-3, 'sunk': bool}, 'medium': {...}, 'small': {...}}
 
     Returns:
-        str: Path to the generated PNG image file
+        BytesIO: The PNG image, ready to upload. Its name attribute is a file
+                 name derived from the inputs, so identical images share a name.
     """
+    image_name = _board_image_name(board, attacker_name, defender_name, theme_color, ships_status)
+    with rendered_images_lock:
+        png = rendered_images.get(image_name)
+        if png is not None:
+            rendered_images.move_to_end(image_name)
+    if png is not None:
+        return _png_buffer(png, image_name)
+
     # Constants
     WIDTH = 400
     HEIGHT = 480
@@ -36,33 +288,18 @@ def generate_board_image(board, attacker_name, defender_name, theme_color='#2C2C
 
     # Parse theme color to determine board style
     if theme_color.startswith('#'):
-        theme_rgb = tuple(int(theme_color[i:i+2], 16) for i in (1, 3, 5))
+        theme_rgb = _hex_to_rgb(theme_color)
     else:
         theme_rgb = (44, 44, 44)
 
     # Determine if this is Player 1 (dark/black) or Player 2 (gray) board
     is_dark_theme = sum(theme_rgb) < 150
 
-    if is_dark_theme:
-        # Player 1's board (BLACK theme) - brightened water by ~20%
-        BG_COLOR = (12, 12, 18)
-        WATER_COLOR1 = (25, 55, 110)   # Was (20, 45, 90)
-        WATER_COLOR2 = (40, 75, 135)   # Was (30, 60, 110)
-        GRID_LINE_COLOR = (70, 85, 110)  # Slightly brighter for contrast
-        ACCENT_COLOR = (70, 130, 200)  # Blue accent
-    else:
-        # Player 2's board (GRAY theme) - brightened water by ~15%
-        BG_COLOR = (25, 28, 35)
-        WATER_COLOR1 = (55, 90, 140)   # Was (45, 75, 120)
-        WATER_COLOR2 = (70, 110, 165)  # Was (55, 90, 140)
-        GRID_LINE_COLOR = (90, 105, 130)  # Slightly brighter for contrast
-        ACCENT_COLOR = (200, 160, 80)  # Gold accent
+    BG_COLOR, WATER_COLOR1, WATER_COLOR2, GRID_LINE_COLOR, ACCENT_COLOR = (
+        DARK_BOARD_PALETTE if is_dark_theme else GRAY_BOARD_PALETTE
+    )
 
     # Common colors
-    SHIP_COLOR = (100, 105, 115)
-    SHIP_HIT_COLOR = (200, 80, 60)
-    SHIP_SUNK_COLOR = (120, 40, 40)
-    MISS_COLOR = (50, 180, 80)
     TEXT_COLOR = (255, 255, 255)
     LABEL_COLOR = (255, 255, 255)
 
@@ -70,65 +307,20 @@ def generate_board_image(board, attacker_name, defender_name, theme_color='#2C2C
     draw = ImageDraw.Draw(img)
 
     # Font setup
-    try:
-        font_title = ImageFont.truetype("arial.ttf", 18)
-        font_label = ImageFont.truetype("arial.ttf", 20)  # Big axis labels
-        font_ship = ImageFont.truetype("arial.ttf", 14)   # Increased from 11 for readability
-        font_small = ImageFont.truetype("arial.ttf", 10)
-    except:
-        font_title = ImageFont.load_default()
-        font_label = ImageFont.load_default()
-        font_ship = ImageFont.load_default()
-        font_small = ImageFont.load_default()
-
-    def draw_gradient_square(x, y, size, color1, color2):
-        for i in range(size):
-            ratio = i / size
-            r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-            g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-            b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-            draw.line([(x, y + i), (x + size - 1, y + i)], fill=(r, g, b))
-
-    def draw_explosion(x, y, size):
-        center_x = x + size // 2
-        center_y = y + size // 2
-        for angle in range(0, 360, 30):
-            rad = math.radians(angle)
-            x1 = center_x + int(math.cos(rad) * size * 0.4)
-            y1 = center_y + int(math.sin(rad) * size * 0.4)
-            draw.line([(center_x, center_y), (x1, y1)], fill=(255, 200, 0), width=2)
-        draw.ellipse([x + size//4, y + size//4, x + 3*size//4, y + 3*size//4], fill=(255, 140, 0))
-        draw.ellipse([x + size//3, y + size//3, x + 2*size//3, y + 2*size//3], fill=(255, 50, 30))
+    font_title = _font(18)
+
+    def draw_static_text(x, y, text, font_size, fill):
+        mask, (left, top) = _text_mask(text, font_size)
+        img.paste(fill, (x + left, y + top), mask)
+
+    def cell_tile(color1, color2, marker=None):
+        inset = {'miss': 12, 'hit': 3}.get(marker, 0)
+        return _cell_tile(CELL_SIZE - 4, color1, color2, marker, inset)
 
     def draw_ship_indicator(x, y, size, hits, is_sunk):
         """Draw a ship segment indicator showing damage status."""
-        segment_width = 22   # Increased from 18 for better mobile visibility
-        segment_height = 16  # Increased from 14 for better mobile visibility
-        gap = 3
-
-        for i in range(size):
-            seg_x = x + i * (segment_width + gap)
-            if is_sunk:
-                color = SHIP_SUNK_COLOR
-            elif i < hits:
-                color = SHIP_HIT_COLOR
-            else:
-                color = SHIP_COLOR
-
-            # Draw rounded segment
-            draw.rounded_rectangle(
-                [seg_x, y, seg_x + segment_width, y + segment_height],
-                radius=3,
-                fill=color,
-                outline=(40, 45, 55) if not is_sunk else (80, 30, 30)
-            )
-
-            # Draw hit marker (X) on damaged segments
-            if i < hits and not is_sunk:
-                draw.line([(seg_x + 4, y + 3), (seg_x + segment_width - 4, y + segment_height - 3)],
-                         fill=(255, 255, 255), width=2)
-                draw.line([(seg_x + segment_width - 4, y + 3), (seg_x + 4, y + segment_height - 3)],
-                         fill=(255, 255, 255), width=2)
+        sprite = _ship_indicator_sprite(size, hits, is_sunk)
+        img.paste(sprite, (x, y), sprite)
 
     # Accent bar at top
     draw.rectangle([0, 0, WIDTH, 5], fill=ACCENT_COLOR)
@@ -147,19 +339,19 @@ def generate_board_image(board, attacker_name, defender_name, theme_color='#2C2C
         x_pos = 10
 
         # Giant Dinghy (3 segments) - 3 * (22+3) = 75px wide
-        draw.text((x_pos, ship_y), "Giant:", font=font_ship, fill=(150, 150, 170))
+        draw_static_text(x_pos, ship_y, "Giant:", 14, (150, 150, 170))
         giant_info = ships_status.get('giant', {'hits': 0, 'sunk': False})
         draw_ship_indicator(x_pos + 48, ship_y, 3, giant_info.get('hits', 0), giant_info.get('sunk', False))
 
         # Average Dinghy (2 segments) - "Mid" is clearer than "Avg" - 2 * (22+3) = 50px wide
         x_pos = 145
-        draw.text((x_pos, ship_y), "Mid:", font=font_ship, fill=(150, 150, 170))
+        draw_static_text(x_pos, ship_y, "Mid:", 14, (150, 150, 170))
         avg_info = ships_status.get('average', {'hits': 0, 'sunk': False})
         draw_ship_indicator(x_pos + 35, ship_y, 2, avg_info.get('hits', 0), avg_info.get('sunk', False))
 
         # Tiny Dinghy (1 segment) - 1 * (22+3) = 25px wide
         x_pos = 255
-        draw.text((x_pos, ship_y), "Tiny:", font=font_ship, fill=(150, 150, 170))
+        draw_static_text(x_pos, ship_y, "Tiny:", 14, (150, 150, 170))
         tiny_info = ships_status.get('tiny', {'hits': 0, 'sunk': False})
         draw_ship_indicator(x_pos + 38, ship_y, 1, tiny_info.get('hits', 0), tiny_info.get('sunk', False))
 
@@ -172,49 +364,60 @@ def generate_board_image(board, attacker_name, defender_name, theme_color='#2C2C
     # Column labels (1-6)
     for j in range(GRID_SIZE):
         label_x = board_x + j * CELL_SIZE + (CELL_SIZE // 2) - 5
-        draw.text((label_x, board_y - 25), str(j + 1), font=font_label, fill=LABEL_COLOR)
+        draw_static_text(label_x, board_y - 25, str(j + 1), 20, LABEL_COLOR)
 
     # Row labels (A-F)
     for i in range(GRID_SIZE):
         label = chr(65 + i)
         label_y = board_y + i * CELL_SIZE + (CELL_SIZE // 2) - 10
-        draw.text((board_x - 30, label_y), label, font=font_label, fill=LABEL_COLOR)
+        draw_static_text(board_x - 30, label_y, label, 20, LABEL_COLOR)
+
+    # Tile for each cell value, so drawing a cell is a lookup and a paste.
+    # Cell values: 0=water, 1-3=unhit ships (hidden), 9=miss, 11-13=hit ships
+    # IMPORTANT: Unhit ships (1-3) must appear as water to hide their positions!
+    water_tile = cell_tile(WATER_COLOR1, WATER_COLOR2)
+    # Miss - water with green circle
+    miss_tile = cell_tile(WATER_COLOR1, WATER_COLOR2, 'miss')
+    # Hit - gray ship background with explosion
+    hit_tile = cell_tile((70, 75, 85), (50, 55, 65), 'hit')
+    tiles_by_cell = {
+        0: water_tile, 1: water_tile, 2: water_tile, 3: water_tile,
+        9: miss_tile,
+        11: hit_tile, 12: hit_tile, 13: hit_tile,
+    }
 
     # Draw grid cells
     for i in range(GRID_SIZE):
         for j in range(GRID_SIZE):
-            x = board_x + j * CELL_SIZE
-            y = board_y + i * CELL_SIZE
-            cell = board[i][j]
-
-            # Cell values: 0=water, 1-3=unhit ships (hidden), 9=miss, 11-13=hit ships
-            # IMPORTANT: Unhit ships (1-3) must appear as water to hide their positions!
-            if cell == 0 or cell in [1, 2, 3]:
-                # Water OR unhit ships - both show as water (ships are hidden)
-                draw_gradient_square(x + 2, y + 2, CELL_SIZE - 4, WATER_COLOR1, WATER_COLOR2)
-            elif cell == 9:
-                # Miss - water with green circle
-                draw_gradient_square(x + 2, y + 2, CELL_SIZE - 4, WATER_COLOR1, WATER_COLOR2)
-                draw.ellipse([x + 14, y + 14, x + CELL_SIZE - 14, y + CELL_SIZE - 14],
-                           fill=MISS_COLOR, outline=(30, 140, 60), width=2)
-            elif cell >= 11:
-                # Hit - gray ship background with explosion
-                draw_gradient_square(x + 2, y + 2, CELL_SIZE - 4, (70, 75, 85), (50, 55, 65))
-                draw_explosion(x + 5, y + 5, CELL_SIZE - 10)
-
-            draw.rectangle([x, y, x + CELL_SIZE, y + CELL_SIZE], outline=GRID_LINE_COLOR, width=1)
+            tile = tiles_by_cell.get(board[i][j])
+            if tile is not None:
+                img.paste(tile, (board_x + j * CELL_SIZE + 2, board_y + i * CELL_SIZE + 2))
+
+    # Grid lines, drawn once across the whole board rather than per cell
+    for k in range(GRID_SIZE + 1):
+        offset = k * CELL_SIZE
+        draw.line([(board_x + offset, board_y), (board_x + offset, board_y + BOARD_WIDTH)], fill=GRID_LINE_COLOR)
+        draw.line([(board_x, board_y + offset), (board_x + BOARD_WIDTH, board_y + offset)], fill=GRID_LINE_COLOR)
 
     # Bottom accent bar
     draw.rectangle([0, HEIGHT - 5, WIDTH, HEIGHT], fill=ACCENT_COLOR)
 
     # Watermark
-    draw.text((WIDTH - 100, HEIGHT - 22), "@battle_dinghy", font=font_small, fill=(80, 90, 110))
+    draw_static_text(WIDTH - 100, HEIGHT - 22, "@battle_dinghy", 10, (80, 90, 110))
 
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-    img.save(temp_file.name, format='PNG', optimize=True)
+    # Encode in memory - the image goes straight to the media upload.
+    # Fast single-pass deflate: the image is uploaded once, and optimize=True
+    # took ~5x longer to encode for a file only a few KB smaller
+    buffer = BytesIO()
+    _to_palette(img).save(buffer, format='PNG', compress_level=1)
+    png = buffer.getvalue()
+
+    with rendered_images_lock:
+        rendered_images[image_name] = png
+        if len(rendered_images) > MAX_RENDERED_IMAGES:
+            rendered_images.popitem(last=False)
 
-    return temp_file.name
+    return _png_buffer(png, image_name)
 
 def generate_battle_dinghy_image(
     player1_board: list[list[str]],  # 6x6, values: 'water'|'miss'|'hit'|'ship'
@@ -243,7 +446,6 @@ def generate_battle_dinghy_image(
     WATER_COLOR2 = (40, 80, 140)  # Gradient end
     SHIP_COLOR1 = (80, 85, 90)  # Gray gradient start
     SHIP_COLOR2 = (60, 65, 70)  # Gray gradient end
-    MISS_COLOR = (50, 180, 80)  # Green for misses
     HIT_COLOR = (255, 100, 50)  # Orange-red for hits
     TEXT_COLOR = (255, 255, 255)
     DIVIDER_COLOR = (60, 70, 80)
@@ -253,50 +455,22 @@ def generate_battle_dinghy_image(
     draw = ImageDraw.Draw(img)
     
     # Font setup with fallback
-    try:
-        font_large = ImageFont.truetype("arial.ttf", 18)
-        font_medium = ImageFont.truetype("arial.ttf", 14)  # Consistent header size
-        font_small = ImageFont.truetype("arial.ttf", 11)
-    except:
-        font_large = ImageFont.load_default()
-        font_medium = ImageFont.load_default()
-        font_small = ImageFont.load_default()
+    font_large = _font(18)
+    font_medium = _font(14)  # Consistent header size
     
     def draw_rounded_rect(x, y, w, h, radius, fill):
         """Draw rounded rectangle"""
         draw.rounded_rectangle([x, y, x + w, y + h], radius=radius, fill=fill)
     
-    def draw_gradient_square(x, y, size, color1, color2):
-        """Draw a square with vertical gradient"""
-        for i in range(size):
-            ratio = i / size
-            r = int(color1[0] + (color2[0] - color1[0]) * ratio)
-            g = int(color1[1] + (color2[1] - color1[1]) * ratio)
-            b = int(color1[2] + (color2[2] - color1[2]) * ratio)
-            draw.line([(x, y + i), (x + size - 1, y + i)], fill=(r, g, b))
+    def draw_static_text(x, y, text, font_size, fill):
+        """Draw text that's the same on every image from its cached mask"""
+        mask, (left, top) = _text_mask(text, font_size)
+        img.paste(fill, (x + left, y + top), mask)
     
-    def draw_explosion(x, y, size):
-        """Draw an explosion burst effect"""
-        center_x = x + size // 2
-        center_y = y + size // 2
-        
-        # Outer explosion rays (yellow)
-        for angle in range(0, 360, 30):
-            rad = math.radians(angle)
-            x1 = center_x + int(math.cos(rad) * size * 0.4)
-            y1 = center_y + int(math.sin(rad) * size * 0.4)
-            draw.line([(center_x, center_y), (x1, y1)], 
-                     fill=(255, 200, 0), width=2)
-        
-        # Middle burst (orange)
-        draw.ellipse([x + size//4, y + size//4, 
-                     x + 3*size//4, y + 3*size//4], 
-                    fill=(255, 140, 0))
-        
-        # Inner core (bright red)
-        draw.ellipse([x + size//3, y + size//3,
-                     x + 2*size//3, y + 2*size//3],
-                    fill=(255, 50, 30))
+    def cell_tile(color1, color2, marker=None):
+        """Get a cell's gradient square with an optional 'miss' or 'hit' marker"""
+        inset = {'miss': 10, 'hit': 3}.get(marker, 0)
+        return _cell_tile(CELL_SIZE - 4, color1, color2, marker, inset)
     
     def draw_ship_status(x, y, ships_dict):
         """Draw ship status indicators with visual ship shapes"""
@@ -343,49 +517,41 @@ def generate_battle_dinghy_image(
         # Draw row labels (A-F)
         for i in range(GRID_SIZE):
             label = chr(65 + i)  # A, B, C, D, E, F
-            draw.text((board_x - 20, grid_y + i * CELL_SIZE + 15),
-                     label, font=font_small, fill=(120, 120, 140))
+            draw_static_text(board_x - 20, grid_y + i * CELL_SIZE + 15,
+                             label, 11, (120, 120, 140))
         
         # Draw column labels (1-6)
         for j in range(GRID_SIZE):
-            draw.text((board_x + j * CELL_SIZE + 20, grid_y - 20),
-                     str(j + 1), font=font_small, fill=(120, 120, 140))
+            draw_static_text(board_x + j * CELL_SIZE + 20, grid_y - 20,
+                             str(j + 1), 11, (120, 120, 140))
+        
+        # Tile for each cell value, so drawing a cell is a lookup and a paste
+        tiles_by_cell = {
+            'water': cell_tile(WATER_COLOR1, WATER_COLOR2),
+            # Water with green circle for miss
+            'miss': cell_tile(WATER_COLOR1, WATER_COLOR2, 'miss'),
+        }
+        if show_ships:
+            tiles_by_cell['ship'] = cell_tile(SHIP_COLOR1, SHIP_COLOR2)
+            # Explosion on ship background if showing ships
+            tiles_by_cell['hit'] = cell_tile(SHIP_COLOR1, SHIP_COLOR2, 'hit')
+        else:
+            tiles_by_cell['hit'] = cell_tile(WATER_COLOR1, WATER_COLOR2, 'hit')
         
         # Draw grid cells
         for i in range(GRID_SIZE):
             for j in range(GRID_SIZE):
-                x = board_x + j * CELL_SIZE
-                y = grid_y + i * CELL_SIZE
-                cell = board_data[i][j]
-                
-                # Draw base cell
-                if cell == 'water':
-                    draw_gradient_square(x + 2, y + 2, CELL_SIZE - 4,
-                                       WATER_COLOR1, WATER_COLOR2)
-                elif cell == 'ship' and show_ships:
-                    draw_gradient_square(x + 2, y + 2, CELL_SIZE - 4,
-                                       SHIP_COLOR1, SHIP_COLOR2)
-                elif cell == 'miss':
-                    # Water background first
-                    draw_gradient_square(x + 2, y + 2, CELL_SIZE - 4,
-                                       WATER_COLOR1, WATER_COLOR2)
-                    # Green circle for miss
-                    draw.ellipse([x + 12, y + 12, x + CELL_SIZE - 12, y + CELL_SIZE - 12],
-                                fill=MISS_COLOR, outline=(30, 140, 60), width=2)
-                elif cell == 'hit':
-                    # Ship background if showing ships
-                    if show_ships:
-                        draw_gradient_square(x + 2, y + 2, CELL_SIZE - 4,
-                                           SHIP_COLOR1, SHIP_COLOR2)
-                    else:
-                        draw_gradient_square(x + 2, y + 2, CELL_SIZE - 4,
-                                           WATER_COLOR1, WATER_COLOR2)
-                    # Explosion effect
-                    draw_explosion(x + 5, y + 5, CELL_SIZE - 10)
-                
-                # Grid lines
-                draw.rectangle([x, y, x + CELL_SIZE, y + CELL_SIZE],
-                              outline=(40, 50, 60), width=1)
+                tile = tiles_by_cell.get(board_data[i][j])
+                if tile is not None:
+                    img.paste(tile, (board_x + j * CELL_SIZE + 2, grid_y + i * CELL_SIZE + 2))
+        
+        # Grid lines, drawn once across the whole board
+        for k in range(GRID_SIZE + 1):
+            offset = k * CELL_SIZE
+            draw.line([(board_x + offset, grid_y), (board_x + offset, grid_y + BOARD_WIDTH)],
+                     fill=(40, 50, 60))
+            draw.line([(board_x, grid_y + offset), (board_x + BOARD_WIDTH, grid_y + offset)],
+                     fill=(40, 50, 60))
     
     # Current Y position tracker
     y_pos = 20
@@ -431,12 +597,11 @@ def generate_battle_dinghy_image(
     
     # Watermark
     watermark = "@battle_dinghy"
-    draw.text((WIDTH - 100, HEIGHT - 20), watermark, 
-             font=font_small, fill=(80, 90, 100))
+    draw_static_text(WIDTH - 100, HEIGHT - 20, watermark, 11, (80, 90, 100))
     
     # Save to BytesIO
     buffer = BytesIO()
-    img.save(buffer, format='PNG', optimize=True)
+    _to_palette(img).save(buffer, format='PNG', compress_level=1)
     buffer.seek(0)
     return buffer
 
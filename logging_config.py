@@ -4,11 +4,69 @@ Logging configuration for Battle Dinghy bot.
 This module provides centralized logging configuration for all bot components.
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 
+# Background thread that passes queued records to the real handlers
+log_listener = None
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that formats each second's timestamp only once.
+
+    With a datefmt that stops at seconds, every record within the same
+    second gets the same time string, so it is reused instead of calling
+    strftime for each record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = None
+        self._last_time = ''
+
+    def formatTime(self, record, datefmt=None):
+        if not datefmt:
+            # The default format includes milliseconds
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_time = super().formatTime(record, datefmt)
+            self._last_second = second
+        return self._last_time
+
+
+class CountingRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that keeps count of the bytes it has written.
+
+    The standard handler asks the file for its size before every record
+    (seek to the end, then tell), which also flushes the write buffer each
+    time. Counting in-process avoids both. A record is never split, so a
+    file can end up one record over max_bytes.
+    """
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self.bytes_written = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def shouldRollover(self, record):
+        return self.maxBytes > 0 and self.bytes_written >= self.maxBytes
+
+    def doRollover(self):
+        super().doRollover()
+        self.bytes_written = 0
+
+    def format(self, record):
+        # Called once per emitted record, right before it is written
+        msg = super().format(record)
+        self.bytes_written += len((msg + self.terminator).encode(self.encoding or 'utf-8'))
+        return msg
+
 
 def setup_logging(
     log_level=logging.INFO,
@@ -32,6 +90,8 @@ def setup_logging(
     Returns:
         logging.Logger: Configured logger instance
     """
+    global log_listener
+
     # Create logs directory if it doesn't exist
     if log_to_file and not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -42,14 +102,16 @@ def setup_logging(
 
     # Clear existing handlers to avoid duplicates
     logger.handlers = []
+    stop_logging()
+    handlers = []
 
     # Create formatters
-    detailed_formatter = logging.Formatter(
+    detailed_formatter = CachedTimeFormatter(
         fmt='%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
-    simple_formatter = logging.Formatter(
+    simple_formatter = CachedTimeFormatter(
         fmt='%(asctime)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -59,17 +121,20 @@ def setup_logging(
         console_handler = logging.StreamHandler()
         console_handler.setLevel(log_level)
         console_handler.setFormatter(simple_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # Log files are named by the date the bot started
+    today = datetime.now().strftime('%Y%m%d')
 
     # File handler with rotation
     if log_to_file:
         # Create timestamped log filename
         log_filename = os.path.join(
             log_dir,
-            f"battle_dinghy_{datetime.now().strftime('%Y%m%d')}.log"
+            f"battle_dinghy_{today}.log"
         )
 
-        file_handler = RotatingFileHandler(
+        file_handler = CountingRotatingFileHandler(
             log_filename,
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -77,16 +142,16 @@ def setup_logging(
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     # Error file handler (only ERROR and CRITICAL)
     if log_to_file:
         error_log_filename = os.path.join(
             log_dir,
-            f"battle_dinghy_errors_{datetime.now().strftime('%Y%m%d')}.log"
+            f"battle_dinghy_errors_{today}.log"
         )
 
-        error_handler = RotatingFileHandler(
+        error_handler = CountingRotatingFileHandler(
             error_log_filename,
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -94,7 +159,14 @@ def setup_logging(
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(detailed_formatter)
-        logger.addHandler(error_handler)
+        handlers.append(error_handler)
+
+    # The handlers run on a background thread: logging calls only put the
+    # record on a queue, so the bot never waits on console or disk writes
+    log_queue = queue.Queue(-1)
+    log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    log_listener.start()
+    logger.addHandler(QueueHandler(log_queue))
 
     # Log startup message
     logger.info("=" * 60)
@@ -109,6 +181,17 @@ def setup_logging(
     return logger
 
 
+def stop_logging():
+    """Write out any queued log records and stop the background logging thread."""
+    global log_listener
+    if log_listener is not None:
+        log_listener.stop()
+        log_listener = None
+
+
+atexit.register(stop_logging)
+
+
 def get_logger(name=None):
     """
     Get a logger instance.
@@ -125,37 +208,42 @@ def get_logger(name=None):
 
 
 # Example usage functions
+# The message arguments are passed to the logger rather than formatted here,
+# so nothing is formatted for records below the logger's level
 def log_game_start(logger, game_number, player1, player2, thread_id):
     """Log game start event."""
-    logger.info(f"Game #{game_number} started: {player1} vs {player2} (thread: {thread_id})")
+    logger.info("Game #%s started: %s vs %s (thread: %s)", game_number, player1, player2, thread_id)
 
 
 def log_game_end(logger, game_number, winner, thread_id, total_moves):
     """Log game end event."""
-    logger.info(f"Game #{game_number} completed: Winner {winner} in {total_moves} moves (thread: {thread_id})")
+    logger.info("Game #%s completed: Winner %s in %s moves (thread: %s)", game_number, winner, total_moves, thread_id)
 
 
 def log_shot(logger, game_number, player, coordinate, result):
     """Log shot event."""
-    logger.debug(f"Game #{game_number}: {player} fired at {coordinate} -> {result}")
+    logger.debug("Game #%s: %s fired at %s -> %s", game_number, player, coordinate, result)
 
 
 def log_api_error(logger, api_name, error, context=""):
     """Log API error."""
-    logger.error(f"{api_name} API error{': ' + context if context else ''}: {error}")
+    if context:
+        logger.error("%s API error: %s: %s", api_name, context, error)
+    else:
+        logger.error("%s API error: %s", api_name, error)
 
 
 def log_database_error(logger, operation, error):
     """Log database error."""
-    logger.error(f"Database error during {operation}: {error}")
+    logger.error("Database error during %s: %s", operation, error)
 
 
 def log_rate_limit(logger, api_name, reset_time=None):
     """Log rate limit hit."""
     if reset_time:
-        logger.warning(f"{api_name} rate limit hit. Resets at {reset_time}")
+        logger.warning("%s rate limit hit. Resets at %s", api_name, reset_time)
     else:
-        logger.warning(f"{api_name} rate limit hit")
+        logger.warning("%s rate limit hit", api_name)
 
 
 # Configuration presets
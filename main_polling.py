@@ -1,31 +1,46 @@
 import tweepy
+import requests
+from requests.adapters import HTTPAdapter
 import os
+import re
 import time
 import sys
+import threading
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from logging_config import setup_logging, get_logger
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('battle_dinghy.log'),
-        logging.StreamHandler()  # Also print to console
-    ]
-)
-logger = logging.getLogger(__name__)
+logger = get_logger('bot')
+
+
+def configure_logging():
+    """
+    Configure logging for the bot process.
+    Only called when running the bot, so importing this module doesn't
+    open the log file or change the logging setup of the importer.
+
+    Records go to the console and the log files from logging_config's
+    background thread. LOG_LEVEL=DEBUG adds the per-poll detail; at the
+    default INFO level those messages are never formatted.
+    """
+    log_level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+    setup_logging(log_level=log_level)
 
 # Add the spec.md directory to the path to import game_logic
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'spec.md'))
 
 # Import our game modules
-from game_logic import create_new_board, process_shot, copy_board, get_ships_remaining, count_hits_and_misses, get_detailed_ship_status
+from game_logic import create_new_board, process_shot, get_detailed_ship_status, summarize_board
 from image_generator import generate_board_image
 from db import (
-    create_game, get_game_by_thread_id, update_game_after_shot,
-    increment_bot_post_count, get_active_games, update_last_checked_tweet_id,
-    is_tweet_processed, mark_tweet_processed, cleanup_old_processed_tweets
+    init_db, create_game, get_game_meta, get_game_boards, get_games_by_thread_ids,
+    update_game_after_shot,
+    get_active_games, update_last_checked_tweet_id,
+    get_processed_tweet_ids, mark_tweet_processed, claim_tweet, cleanup_old_processed_tweets,
+    update_player_usernames, get_bot_state, set_bot_state,
+    listen_for_game_changes, has_game_changes
 )
 
 # Load environment variables
@@ -34,6 +49,90 @@ load_dotenv()
 # Bot username
 BOT_USERNAME = "battle_dinghy"
 
+# Coordinate pattern: a1, 1a (rows A-E, columns 1-5) as a whole word of the
+# lowercased tweet, allowing surrounding punctuation like "a1!" or "1a,"
+COORDINATE_PATTERN = re.compile(r'(?:^|\s)[,:;!?.]*([a-e][1-5]|[1-5][a-e])[,:;!?.]*(?!\S)')
+
+# A coordinate right after a word that introduces it, e.g. "fire a1"
+FIRE_COORDINATE_PATTERN = re.compile(
+    r'(?:^|\s)(?:fire|shoot|at)\s+[,:;!?.]*([a-e][1-5]|[1-5][a-e])[,:;!?.]*(?!\S)'
+)
+
+# Every coordinate contains a column digit 1-5, so tweets without one
+# (most chatter in a game thread) can skip the pattern searches
+COORDINATE_DIGIT_PATTERN = re.compile(r'[1-5]')
+
+
+def _keyword_pattern(keywords):
+    """Compile a list of keywords/phrases into a single substring-matching regex."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+# Challenge detection keywords, matched as substrings of the lowercased tweet
+# Strong challenge indicators (3 points)
+STRONG_CHALLENGE_PATTERN = _keyword_pattern([
+    'play', 'playing', 'played', 'challenge', 'challenging', 'challenged',
+    'battle', 'battling', 'fight', 'fighting', 'game', 'gaming',
+    'match', 'versus', 'vs', 'against'
+])
+# Invitation indicators (2 points)
+INVITATION_PATTERN = _keyword_pattern([
+    'wanna', 'wana', 'want', 'wants', 'lets', "let's",
+    'ready', 'down', 'dare', 'bet', 'up for', 'fancy'
+])
+# Challenge phrases (3 points)
+CHALLENGE_PHRASE_PATTERN = _keyword_pattern([
+    'start game', 'new game', 'begin match', '1v1', 'one on one',
+    'you and me', 'with me', 'challenge you', 'i challenge',
+    'game of', 'play a game', 'to a game', 'battleship', 'battle dinghy'
+])
+# Question starters (2 points)
+QUESTION_STARTERS = frozenset(['who', 'anyone', 'anybody'])
+
+# Starting board image state: nothing fired at yet, all ships at full health.
+# generate_board_image only reads these, so they are shared between games.
+BLANK_BOARD = tuple((0,) * 5 for _ in range(5))  # 5x5 grid
+INITIAL_SHIP_STATUS = {
+    'giant': {'hits': 0, 'sunk': False, 'size': 3},
+    'average': {'hits': 0, 'sunk': False, 'size': 2},
+    'tiny': {'hits': 0, 'sunk': False, 'size': 1}
+}
+
+# Game threads searched per API call. Search queries are limited to 512
+# characters and each "conversation_id:<id> OR " clause is about 40,
+# leaving room for the "-from:" filter.
+MAX_THREADS_PER_SEARCH = 10
+
+# Seconds between poll cycles. Lower values make moves feel faster but use
+# more of the search rate limit while idle.
+POLL_INTERVAL_SECONDS = int(os.getenv("POLL_INTERVAL_SECONDS", "60"))
+
+# Seconds between poll cycles right after a cycle that found new tweets.
+# Each idle cycle doubles the wait until it is back to POLL_INTERVAL_SECONDS,
+# so replies in a live game are picked up quickly without polling faster
+# while nothing is happening.
+ACTIVE_POLL_INTERVAL_SECONDS = min(
+    int(os.getenv("ACTIVE_POLL_INTERVAL_SECONDS", "10")), POLL_INTERVAL_SECONDS
+)
+
+# How often to clean up old processed tweets from the database
+CLEANUP_INTERVAL_SECONDS = 60 * 60
+
+# Recent search only covers the last 7 days and rejects a since_id older than
+# that. Tweet IDs are snowflakes whose top bits are the creation time in
+# milliseconds since TWITTER_EPOCH_MS.
+RECENT_SEARCH_WINDOW_SECONDS = 7 * 24 * 60 * 60
+TWITTER_EPOCH_MS = 1288834974657
+
+# Shared HTTP session for all Twitter API calls (v2 client and v1.1 media uploads)
+# so connections to Twitter stay alive between calls instead of re-handshaking
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+# Background worker for rendering and uploading board images while other
+# network calls are in flight
+image_executor = ThreadPoolExecutor(max_workers=1)
+
 # Defer client initialization - will be created on first use
 client = None
 BOT_USER_ID = None
@@ -53,12 +152,12 @@ def get_twitter_client():
         'X_ACCESS_TOKEN': os.getenv("X_ACCESS_TOKEN") is not None,
         'X_ACCESS_TOKEN_SECRET': os.getenv("X_ACCESS_TOKEN_SECRET") is not None,
     }
-    logger.info(f"Environment variables present: {env_vars}")
+    logger.info("Environment variables present: %s", env_vars)
 
     # Check for missing credentials
     missing = [k for k, v in env_vars.items() if not v]
     if missing:
-        logger.error(f"Missing Twitter credentials: {missing}")
+        logger.error("Missing Twitter credentials: %s", missing)
         raise ValueError(f"Missing Twitter credentials: {missing}")
 
     client = tweepy.Client(
@@ -69,19 +168,67 @@ def get_twitter_client():
         access_token_secret=os.getenv("X_ACCESS_TOKEN_SECRET"),
         wait_on_rate_limit=True
     )
+    client.session = http_session
 
     # Get bot's numeric user ID
     try:
         bot_user = client.get_user(username=BOT_USERNAME)
         BOT_USER_ID = str(bot_user.data.id) if bot_user.data else None
-        logger.info(f"Bot user ID: {BOT_USER_ID}")
+        logger.info("Bot user ID: %s", BOT_USER_ID)
     except Exception as e:
-        logger.warning(f"Could not get bot user ID: {e}")
+        logger.warning("Could not get bot user ID: %s", e)
         BOT_USER_ID = None
 
     return client
 
 
+# v1.1 API client for media uploads, created on first use like the v2 client
+media_api = None
+
+def get_media_api():
+    """Get or create the Tweepy v1.1 API client used for media uploads."""
+    global media_api
+
+    if media_api is not None:
+        return media_api
+
+    auth = tweepy.OAuth1UserHandler(
+        os.getenv("X_API_KEY"),
+        os.getenv("X_API_SECRET"),
+        os.getenv("X_ACCESS_TOKEN"),
+        os.getenv("X_ACCESS_TOKEN_SECRET")
+    )
+    media_api = tweepy.API(auth)
+    media_api.session = http_session
+    return media_api
+
+
+# Cache for Twitter user ID <-> username lookups
+# Players don't change usernames mid-game, and every turn looks up the same
+# handful of users, so this saves rate-limited get_user() calls.
+# Limited to MAX_USER_CACHE_SIZE entries to prevent memory growth
+MAX_USER_CACHE_SIZE = 4096
+username_by_id = {}
+user_id_by_username = {}
+
+
+def cache_user(user_id, username):
+    """
+    Remember a user ID <-> username pair for future lookups.
+
+    Args:
+        user_id: Twitter user ID
+        username: Twitter username (without @)
+    """
+    if len(username_by_id) >= MAX_USER_CACHE_SIZE:
+        logger.info("User cache reached %d entries, clearing...", len(username_by_id))
+        username_by_id.clear()
+        user_id_by_username.clear()
+
+    username_by_id[str(user_id)] = username
+    user_id_by_username[username.lower()] = str(user_id)
+
+
 def get_username_from_response(user_id, response):
     """
     Extract username from Twitter API response.includes data.
@@ -94,16 +241,25 @@ def get_username_from_response(user_id, response):
     Returns:
         str: Username if found, otherwise the user_id as fallback
     """
+    cache_response_users(response)
+    return username_by_id.get(str(user_id), str(user_id))  # Fallback to ID if not found
+
+
+def cache_response_users(response):
+    """
+    Cache the usernames from a Twitter API response's includes data.
+
+    Args:
+        response: Twitter API response object with includes data
+    """
     if response.includes and 'users' in response.includes:
         for user in response.includes['users']:
-            if str(user.id) == str(user_id):
-                return user.username
-    return str(user_id)  # Fallback to ID if not found
+            cache_user(user.id, user.username)
 
 
 def get_username_by_id(user_id):
     """
-    Get a username from a user ID by making an API call.
+    Get a username from a user ID, using the cache before making an API call.
     Used when username isn't available in response.includes.
 
     Args:
@@ -112,20 +268,173 @@ def get_username_by_id(user_id):
     Returns:
         str: Username if found, otherwise the user_id as fallback
     """
+    cached = username_by_id.get(str(user_id))
+    if cached:
+        return cached
+
     try:
         user_response = get_twitter_client().get_user(id=user_id)
         if user_response.data:
+            cache_user(user_response.data.id, user_response.data.username)
             return user_response.data.username
     except Exception as e:
-        logger.warning(f"Could not get username for ID {user_id}: {e}")
+        logger.warning("Could not get username for ID %s: %s", user_id, e)
     return str(user_id)  # Fallback to ID
 
 
+def get_usernames_by_ids(user_ids):
+    """
+    Get usernames for several user IDs with at most one API call.
+    IDs already in the cache are not looked up again.
+
+    Args:
+        user_ids: Iterable of Twitter user IDs to lookup
+
+    Returns:
+        dict: Mapping of user ID (str) to username, falling back to the ID itself
+    """
+    user_ids = [str(user_id) for user_id in user_ids]
+    missing = list({user_id for user_id in user_ids if user_id not in username_by_id})
+
+    if missing:
+        try:
+            users_response = get_twitter_client().get_users(ids=missing)
+            for user in users_response.data or []:
+                cache_user(user.id, user.username)
+        except Exception as e:
+            logger.warning("Could not get usernames for IDs %s: %s", missing, e)
+
+    return {user_id: username_by_id.get(user_id, user_id) for user_id in user_ids}
+
+
+def get_player_usernames(game_data):
+    """
+    Get both players' usernames for a game.
+    Uses the usernames stored with the game, resolving and backfilling them
+    for games created before they were stored.
+
+    Args:
+        game_data: The game data from the database
+
+    Returns:
+        tuple: (player1_username, player2_username)
+    """
+    player1_username = game_data.get('player1_username')
+    player2_username = game_data.get('player2_username')
+    if player1_username and player2_username:
+        return player1_username, player2_username
+
+    player1_id = game_data['player1_id']
+    player2_id = game_data['player2_id']
+    usernames = get_usernames_by_ids([player1_id, player2_id])
+    player1_username = usernames[player1_id]
+    player2_username = usernames[player2_id]
+
+    # Only backfill real usernames, not the ID fallback
+    if player1_username != player1_id and player2_username != player2_id:
+        update_player_usernames(game_data['thread_id'], player1_username, player2_username)
+        game_data['player1_username'] = player1_username
+        game_data['player2_username'] = player2_username
+
+    return player1_username, player2_username
+
+
+def get_user_id_by_username(username):
+    """
+    Get a user ID from a username, using the cache before making an API call.
+
+    Args:
+        username: Twitter username to lookup (without @)
+
+    Returns:
+        str: User ID if found, None if the user doesn't exist
+
+    Raises:
+        Exception: If the Twitter API call fails
+    """
+    cached = user_id_by_username.get(username.lower())
+    if cached:
+        return cached
+
+    user_response = get_twitter_client().get_user(username=username)
+    if not user_response.data:
+        return None
+
+    cache_user(user_response.data.id, user_response.data.username)
+    return str(user_response.data.id)
+
+
+# Cache of uploaded media IDs by image name. Rendered images are named by a
+# hash of their content, so the same name means the same picture and its
+# upload can be reused. Twitter expires uploaded media after 24 hours.
+# Limited to MAX_MEDIA_CACHE_SIZE entries; the oldest uploads are evicted
+# first. Uploads run on image_executor as well as the main thread, so the
+# cache is only touched while holding media_ids_lock.
+MEDIA_ID_TTL_SECONDS = 12 * 60 * 60
+MAX_MEDIA_CACHE_SIZE = 1024
+media_ids_by_name = OrderedDict()
+media_ids_lock = threading.Lock()
+
+
+def upload_media(image):
+    """
+    Upload an image for a tweet, reusing a recent upload of the same image.
+    Media upload is v1.1 only, so this goes through get_media_api().
+
+    Args:
+        image: PNG file object from generate_board_image()
+
+    Returns:
+        The media ID to pass to create_tweet(media_ids=[...])
+    """
+    with media_ids_lock:
+        cached = media_ids_by_name.get(image.name)
+    if cached and time.time() - cached[1] < MEDIA_ID_TTL_SECONDS:
+        return cached[0]
+
+    # The upload itself runs outside the lock, so the other thread's
+    # lookups don't wait on the network
+    image.seek(0)
+    media = get_media_api().media_upload(image.name, file=image)
+
+    with media_ids_lock:
+        media_ids_by_name[image.name] = (media.media_id, time.time())
+        media_ids_by_name.move_to_end(image.name)
+        while len(media_ids_by_name) > MAX_MEDIA_CACHE_SIZE:
+            media_ids_by_name.popitem(last=False)
+    return media.media_id
+
+
+def render_and_upload_board(*image_args):
+    """
+    Render a board image and upload it, so both can run on image_executor.
+
+    Args:
+        *image_args: Arguments for generate_board_image()
+
+    Returns:
+        tuple: (the PNG file object, its media ID)
+    """
+    image = generate_board_image(*image_args)
+    return image, upload_media(image)
+
+
 # Cache for processed tweet IDs to prevent double-processing
-# Limited to MAX_CACHE_SIZE entries to prevent memory growth
+# Limited to MAX_CACHE_SIZE entries to prevent memory growth; the least
+# recently seen IDs are evicted first, so recent tweets stay cached
 # Also persisted to database to survive restarts
-MAX_CACHE_SIZE = 500
-processed_tweet_ids = set()
+MAX_CACHE_SIZE = 4096
+processed_tweet_ids = OrderedDict()
+
+
+def cache_processed_tweet(tweet_id_str):
+    """Add a tweet ID to the memory cache, evicting the oldest entry if it's full."""
+    processed_tweet_ids[tweet_id_str] = True
+    processed_tweet_ids.move_to_end(tweet_id_str)
+
+    # If cache is full, drop the least recently seen ID (DB is the source of truth)
+    if len(processed_tweet_ids) > MAX_CACHE_SIZE:
+        processed_tweet_ids.popitem(last=False)
 
 
 def add_processed_tweet(tweet_id):
@@ -133,40 +442,64 @@ def add_processed_tweet(tweet_id):
     Add a tweet ID to the processed cache AND database.
     Memory cache provides fast lookups, DB provides persistence across restarts.
     """
-    global processed_tweet_ids
     tweet_id_str = str(tweet_id)
 
-    # If cache is getting too large, clear it (DB is the source of truth)
-    if len(processed_tweet_ids) >= MAX_CACHE_SIZE:
-        logger.info(f"Processed tweet cache reached {len(processed_tweet_ids)} entries, clearing memory cache...")
-        processed_tweet_ids.clear()
-        logger.info("Memory cache cleared (DB still has records)")
-
     # Add to memory cache
-    processed_tweet_ids.add(tweet_id_str)
+    cache_processed_tweet(tweet_id_str)
 
     # Persist to database (survives restarts)
     mark_tweet_processed(tweet_id_str)
 
 
-def is_already_processed(tweet_id):
+def claim_processed_tweet(tweet_id):
     """
-    Check if a tweet has already been processed.
-    First checks memory cache (fast), then falls back to database (persistent).
+    Mark a tweet as processed unless it already was, in one DB round-trip.
+    Use before acting on a tweet so it can only ever be handled once.
+
+    Returns:
+        bool: True if the tweet was claimed, False if it was already processed
     """
     tweet_id_str = str(tweet_id)
 
     # Fast path: check memory cache first
     if tweet_id_str in processed_tweet_ids:
-        return True
+        return False
+
+    cache_processed_tweet(tweet_id_str)
+
+    # The database decides - it also knows about tweets from before a restart
+    return claim_tweet(tweet_id_str)
+
+
+def get_already_processed(tweet_ids):
+    """
+    Check which of several tweets have already been processed.
+    First checks memory cache (fast), then looks up the rest in the
+    database (persistent) with a single query.
+
+    Args:
+        tweet_ids: Iterable of tweet IDs to check
+
+    Returns:
+        set: The tweet IDs (as strings) that have already been processed
+    """
+    tweet_ids = {str(tweet_id) for tweet_id in tweet_ids}
 
-    # Slow path: check database (handles restart case)
-    if is_tweet_processed(tweet_id_str):
+    # Fast path: check memory cache first
+    already_processed = {tweet_id for tweet_id in tweet_ids if tweet_id in processed_tweet_ids}
+    for tweet_id in already_processed:
+        processed_tweet_ids.move_to_end(tweet_id)
+
+    # Slow path: check database for the rest (handles restart case)
+    unknown = tweet_ids - already_processed
+    if unknown:
+        found = get_processed_tweet_ids(unknown)
         # Add to memory cache for future fast lookups
-        processed_tweet_ids.add(tweet_id_str)
-        return True
+        for tweet_id in found:
+            cache_processed_tweet(tweet_id)
+        already_processed |= found
 
-    return False
+    return already_processed
 
 
 def parse_coordinate_from_text(tweet_text):
@@ -179,44 +512,65 @@ def parse_coordinate_from_text(tweet_text):
     Returns:
         str: The coordinate if found, None otherwise
     """
-    import re
+    if not COORDINATE_DIGIT_PATTERN.search(tweet_text):
+        return None
 
     text_lower = tweet_text.lower()
-    words = text_lower.split()
-
-    coordinate = None
-
-    # Look for coordinate after "fire", "at", "shoot", or just find any A-E + 1-5 pattern
-    for i, word in enumerate(words):
-        if word in ["fire", "shoot", "at"]:
-            # Check next word
-            if i + 1 < len(words):
-                potential_coord = words[i + 1].strip(',:;!?.')
-                # Validate it's a real coordinate (A-E, 1-5)
-                pattern = r'^([a-e][1-5]|[1-5][a-e])$'
-                if re.fullmatch(pattern, potential_coord):
-                    coordinate = potential_coord
-                    break
 
-    # If no coordinate found after keywords, search for A-E + 1-5 pattern
-    if not coordinate:
-        # Match EXACT patterns: a1, A1, 1a, 1A (must be whole word)
-        pattern = r'^([a-e][1-5]|[1-5][a-e])$'
-        for word in words:
-            clean_word = word.strip(',:;!?.').lower()
-            match = re.fullmatch(pattern, clean_word)
-            if match:
-                coord_str = match.group()
-                # Normalize to A1 format (letter first)
-                if coord_str[0].isdigit():
-                    coordinate = coord_str[1] + coord_str[0]  # Swap to letter-first
-                else:
-                    coordinate = coord_str
-                break
+    # Prefer a coordinate after "fire", "at" or "shoot", otherwise take the
+    # first coordinate anywhere in the tweet
+    match = FIRE_COORDINATE_PATTERN.search(text_lower) or COORDINATE_PATTERN.search(text_lower)
+    if not match:
+        return None
 
+    coordinate = match.group(1)
+    # Normalize to A1 format (letter first)
+    if coordinate[0].isdigit():
+        coordinate = coordinate[1] + coordinate[0]
     return coordinate
 
 
+def score_challenge_confidence(tweet_text):
+    """
+    Score how likely a tweet mentioning the bot is a game challenge.
+
+    Args:
+        tweet_text: The text of the tweet
+
+    Returns:
+        int: Confidence score (3 or more is considered a challenge)
+    """
+    tweet_text_lower = tweet_text.lower()
+
+    # Remove bot username to avoid false positives from keywords in username
+    # e.g., @battle_dinghy contains "battle" but shouldn't count
+    text_without_bot = tweet_text_lower.replace(f'@{BOT_USERNAME.lower()}', '')
+
+    confidence_score = 0
+
+    # Each keyword category only counts once
+    if STRONG_CHALLENGE_PATTERN.search(text_without_bot):
+        confidence_score += 3
+    if INVITATION_PATTERN.search(text_without_bot):
+        confidence_score += 2
+    if CHALLENGE_PHRASE_PATTERN.search(text_without_bot):
+        confidence_score += 3
+
+    # Structural indicators (1 point each)
+    mention_count = tweet_text_lower.count('@')
+    if mention_count >= 2:  # Has opponent mention
+        confidence_score += 1
+    if '?' in tweet_text_lower:  # Question format (invitation)
+        confidence_score += 1
+
+    # Question starters (2 points)
+    first_word = tweet_text_lower.strip().split()[0] if tweet_text_lower.strip() else ''
+    if first_word in QUESTION_STARTERS:
+        confidence_score += 2
+
+    return confidence_score
+
+
 def process_fire_tweet(tweet, game_data, author_username, opponent_username):
     """
     Process a fire command from a tweet.
@@ -228,7 +582,8 @@ def process_fire_tweet(tweet, game_data, author_username, opponent_username):
         opponent_username: The username of the opponent (defender)
 
     Returns:
-        bool: True if the fire was processed successfully, False otherwise
+        bool: True if the fire was processed successfully, False otherwise.
+              On success game_data is updated in place with the saved game state.
     """
     author_id = str(tweet.author_id)
     thread_id = game_data['thread_id']
@@ -265,18 +620,17 @@ def process_fire_tweet(tweet, game_data, author_username, opponent_username):
         next_turn = 'player1'
         shooter_board_theme = p1_theme
 
-    # Make a copy of the target board to avoid mutations
-    target_board_copy = copy_board(target_board)
-
     # Process the shot - returns (result_code, updated_board, ship_name)
+    # process_shot marks the board in place. No copy is needed: game_data is
+    # replaced with the saved row on success, and the caller discards it
+    # (re-reading from the database) whenever this returns False or raises.
     result_code, updated_board, ship_name = process_shot(
         coordinate,
-        target_board_copy,
-        target_board_copy
+        target_board,
+        target_board
     )
 
-    print(f"Shot result: {result_code}, ship: {ship_name}")
-    logger.info(f"Shot processed in {thread_id}: {coordinate} -> {result_code}")
+    logger.info("Shot processed in %s: %s -> %s (ship: %s)", thread_id, coordinate, result_code, ship_name)
 
     # Handle invalid coordinate
     if result_code == "INVALID":
@@ -294,7 +648,7 @@ def process_fire_tweet(tweet, game_data, author_username, opponent_username):
             text=reply_text,
             in_reply_to_tweet_id=tweet.id
         )
-        logger.info(f"Duplicate shot attempt at {coordinate} - no turn change")
+        logger.info("Duplicate shot attempt at %s - no turn change", coordinate)
         return False
 
     # Build the result message with @usernames (no pronouns)
@@ -306,32 +660,30 @@ def process_fire_tweet(tweet, game_data, author_username, opponent_username):
     elif result_code == "SUNK":
         result_text = f"@{author_username} sunk @{opponent_username}'s {ship_name}! 💥🚢"
 
-    # Check ships remaining and game end condition
-    ships_remaining = get_ships_remaining(updated_board)
+    # Check ships remaining and game end condition, and get the scoreboard
+    # stats and detailed ship status for the result image from the same pass
+    ships_remaining, hits, misses, ship_status = summarize_board(updated_board)
     game_over = ships_remaining['total'] == 0
 
+    # Post numbers for the result tweet and, if the game goes on, the
+    # prompt tweet are reserved by the same update
+    posts_needed = 1 if game_over else 2
+
     # Update the game state in database with turn validation
     current_turn = game_data['turn']
-    if game_over:
-        db_result = update_game_after_shot(
-            thread_id,
-            board_to_update,
-            updated_board,
-            'completed',
-            current_turn
-        )
-    else:
-        db_result = update_game_after_shot(
-            thread_id,
-            board_to_update,
-            updated_board,
-            next_turn,
-            current_turn
-        )
+    db_result = update_game_after_shot(
+        thread_id,
+        board_to_update,
+        updated_board,
+        'completed' if game_over else next_turn,
+        current_turn,
+        shooter_id=author_id,
+        posts_to_reserve=posts_needed
+    )
 
     # Check if database update failed (race condition detected)
     if not db_result:
-        print(f"Database update failed - race condition detected or game no longer active")
+        logger.warning("Database update failed - race condition detected or game no longer active")
         reply_text = f"⚠️ @{author_username}, something went wrong. The game state changed. Please try again!"
         get_twitter_client().create_tweet(
             text=reply_text,
@@ -339,11 +691,33 @@ def process_fire_tweet(tweet, game_data, author_username, opponent_username):
         )
         return False
 
-    # Get scoreboard stats
-    hits, misses = count_hits_and_misses(updated_board)
+    # Keep the caller's copy in sync so it doesn't need to re-read the game
+    game_data.update(db_result)
 
-    # Get detailed ship status for visual display
-    ship_status = get_detailed_ship_status(updated_board)
+    # If game is not over, start rendering and uploading the next player's
+    # board now - it only depends on the opponent's board, so it can run
+    # while the result image is rendered, uploaded and posted
+    opponent_upload_future = None
+    if not game_over:
+        if author_id == player1_id:
+            opponent_board = game_data['player1_board']
+            opponent_board_theme = p1_theme
+        else:
+            opponent_board = game_data['player2_board']
+            opponent_board_theme = p2_theme
+
+        # Get detailed ship status for visual display
+        next_turn_ship_status = get_detailed_ship_status(opponent_board)
+
+        # Generate and upload board image for the NEXT player's turn
+        opponent_upload_future = image_executor.submit(
+            render_and_upload_board,
+            opponent_board,
+            f"@{opponent_username}",
+            f"@{author_username}",
+            opponent_board_theme,
+            next_turn_ship_status
+        )
 
     # Generate the result image
     result_image = generate_board_image(
@@ -354,10 +728,10 @@ def process_fire_tweet(tweet, game_data, author_username, opponent_username):
         ship_status
     )
 
-    print(f"Generated result image: {result_image}")
+    logger.debug("Generated result image: %s", result_image.name)
 
-    # Get post number for result tweet
-    result_post_number = increment_bot_post_count(thread_id)
+    last_post_number = db_result['bot_post_count']
+    result_post_number = last_post_number - posts_needed + 1
     game_number = game_data.get('game_number', 1)
 
     # Build result tweet with scoreboard (no pronouns)
@@ -381,272 +755,453 @@ def process_fire_tweet(tweet, game_data, author_username, opponent_username):
         )
 
     # Upload image using v1.1 API
-    auth = tweepy.OAuth1UserHandler(
-        os.getenv("X_API_KEY"),
-        os.getenv("X_API_SECRET"),
-        os.getenv("X_ACCESS_TOKEN"),
-        os.getenv("X_ACCESS_TOKEN_SECRET")
-    )
-    api = tweepy.API(auth)
-    media = api.media_upload(result_image)
+    media_id = upload_media(result_image)
 
     # Post the result tweet - reply to the THREAD not the fire command
     result_tweet = get_twitter_client().create_tweet(
         text=result_tweet_text,
         in_reply_to_tweet_id=thread_id,
-        media_ids=[media.media_id]
+        media_ids=[media_id]
     )
 
-    print(f"Posted result tweet {result_tweet.data['id']}")
+    logger.info("Posted result tweet %s", result_tweet.data['id'])
 
     # If game is not over, prompt the opponent for their turn
     if not game_over:
-        if author_id == player1_id:
-            opponent_board = game_data['player1_board']
-            opponent_board_theme = p1_theme
-        else:
-            opponent_board = game_data['player2_board']
-            opponent_board_theme = p2_theme
-
-        # Get detailed ship status for visual display
-        next_turn_ship_status = get_detailed_ship_status(opponent_board)
-
-        # Generate board image for the NEXT player's turn
-        opponent_image = generate_board_image(
-            opponent_board,
-            f"@{opponent_username}",
-            f"@{author_username}",
-            opponent_board_theme,
-            next_turn_ship_status
-        )
-
-        print(f"Generated opponent image: {opponent_image}")
+        opponent_image, opponent_media_id = opponent_upload_future.result()
 
-        # Get post number for prompt tweet
-        prompt_post_number = increment_bot_post_count(thread_id)
+        logger.debug("Uploaded opponent image: %s", opponent_image.name)
 
-        # Upload opponent's board image
-        media_opponent = api.media_upload(opponent_image)
+        prompt_post_number = last_post_number
 
         # Post the prompt tweet (no pronouns - use @username)
         prompt_text = f"{prompt_post_number}/ @{opponent_username}'s turn! Fire at @{author_username}'s fleet! 🎯"
         prompt_tweet = get_twitter_client().create_tweet(
             text=prompt_text,
             in_reply_to_tweet_id=thread_id,
-            media_ids=[media_opponent.media_id]
+            media_ids=[opponent_media_id]
         )
 
-        print(f"Posted prompt tweet {prompt_tweet.data['id']}")
+        logger.info("Posted prompt tweet %s", prompt_tweet.data['id'])
     else:
-        print(f"Game over! @{author_username} wins!")
+        logger.info("Game over! @%s wins!", author_username)
 
-    print("Turn completed successfully!")
+    logger.debug("Turn completed successfully!")
     return True
 
 
-def monitor_active_games():
+# Active games from the last poll. They're only re-read from the database
+# when a games_changed notification says the set of games may differ, or
+# every ACTIVE_GAMES_REFRESH_SECONDS in case a notification was missed.
+ACTIVE_GAMES_REFRESH_SECONDS = 10 * 60
+active_games_cache = None
+active_games_loaded_at = 0
+game_changes_listener = None
+
+
+def get_monitored_games():
     """
-    Monitor active game threads for fire commands WITHOUT requiring @mentions.
+    Get the active games to monitor, re-reading them only when they changed.
 
-    This function:
-    1. Gets all active games from the database
-    2. For each game, searches the conversation for new replies
-    3. Looks for fire patterns (fire A1, A1, etc.)
-    4. Processes valid fire commands
+    Returns:
+        list: List of active game records (see get_active_games)
+    """
+    global active_games_cache, active_games_loaded_at, game_changes_listener
 
-    This allows players to just reply "fire A1" without mentioning @battle_dinghy.
+    if game_changes_listener is None:
+        game_changes_listener = listen_for_game_changes()
+        # Anything may have changed while we weren't listening
+        active_games_cache = None
+
+    try:
+        changed = game_changes_listener is None or has_game_changes(game_changes_listener)
+    except Exception as e:
+        logger.warning("Lost game change listener, reconnecting next poll: %s", e)
+        game_changes_listener = None
+        changed = True
+
+    stale = time.time() - active_games_loaded_at > ACTIVE_GAMES_REFRESH_SECONDS
+    if changed or stale or not active_games_cache:
+        # An empty result isn't kept: it's cheap to re-check, and
+        # get_active_games also returns [] when the query fails
+        active_games_cache = get_active_games()
+        active_games_loaded_at = time.time()
+
+    return active_games_cache
+
+
+def usable_since_id(tweet_id):
     """
-    print("\nMonitoring active game threads for fire commands...")
+    Check whether a tweet ID can be passed to the recent search as since_id.
 
-    # Get all active games
-    active_games = get_active_games()
+    Args:
+        tweet_id: Tweet ID checkpoint, or None
 
-    if not active_games:
-        print("No active games to monitor")
-        return
+    Returns:
+        The tweet ID if it is inside the recent search window, otherwise None
+    """
+    if not tweet_id:
+        return None
 
-    print(f"Monitoring {len(active_games)} active game(s)")
+    created_at = ((int(tweet_id) >> 22) + TWITTER_EPOCH_MS) / 1000
+    # Leave an hour's margin, since the window is measured by Twitter's clock
+    if time.time() - created_at > RECENT_SEARCH_WINDOW_SECONDS - 60 * 60:
+        return None
+    return tweet_id
 
-    for game in active_games:
-        thread_id = game['thread_id']
-        last_checked = game.get('last_checked_tweet_id')
 
-        logger.info(f"Checking thread {thread_id} (last_checked: {last_checked})")
+def search_game_threads(games):
+    """
+    Search several game threads for new replies with a single query.
 
-        try:
-            # Search for tweets in this conversation
-            # Note: Twitter API requires searching by conversation_id
-            query = f"conversation_id:{thread_id}"
+    Every result page is fetched, so no reply is left out when a thread's
+    checkpoint moves past it. If any page fails, the exception propagates
+    and no thread is processed or checkpointed.
 
-            search_params = {
-                'query': query,
-                'max_results': 20,  # Check more tweets per thread
-                'tweet_fields': ['author_id', 'created_at', 'conversation_id'],
-                'expansions': ['author_id'],
-                'user_fields': ['username']
-            }
+    Args:
+        games: List of active game records (at most MAX_THREADS_PER_SEARCH)
 
-            if last_checked:
-                search_params['since_id'] = last_checked
+    Returns:
+        dict: thread_id -> its new tweets, oldest first
+    """
+    # One conversation_id clause per game, e.g. "conversation_id:1 OR conversation_id:2"
+    # The bot's own replies are excluded server-side so they don't use result slots
+    conversations = " OR ".join(f"conversation_id:{game['thread_id']}" for game in games)
+    query = f"({conversations}) -from:{BOT_USERNAME}"
+
+    search_params = {
+        'query': query,
+        'max_results': 100,
+        'tweet_fields': ['author_id', 'conversation_id'],
+        'expansions': ['author_id'],
+        'user_fields': ['username']
+    }
 
-            response = get_twitter_client().search_recent_tweets(**search_params)
+    # Only new tweets are needed; since_id must cover the least recently checked
+    # thread, and is left out if any thread has no checkpoint inside the
+    # search window (monitor_active_games batches those threads separately)
+    last_checked_ids = [usable_since_id(game.get('last_checked_tweet_id')) for game in games]
+    if all(last_checked_ids):
+        search_params['since_id'] = min(last_checked_ids, key=int)
 
-            if not response.data:
-                print(f"  No new tweets in thread {thread_id}")
-                continue
+    tweets_by_thread = {game['thread_id']: [] for game in games}
+    while True:
+        response = get_twitter_client().search_recent_tweets(**search_params)
 
-            print(f"  Found {len(response.data)} new tweet(s) in thread {thread_id}")
+        # Usernames for the fire command authors, cached for later lookups
+        cache_response_users(response)
 
-            # Track the highest tweet ID we process
-            newest_tweet_id = last_checked
+        for tweet in response.data or []:
+            thread_tweets = tweets_by_thread.get(str(tweet.conversation_id))
+            if thread_tweets is not None:
+                thread_tweets.append(tweet)
 
-            for tweet in response.data:
-                tweet_id = str(tweet.id)
+        next_token = (response.meta or {}).get('next_token')
+        if not next_token:
+            break
+        search_params['next_token'] = next_token
 
-                # Update newest_tweet_id tracker
-                if not newest_tweet_id or int(tweet_id) > int(newest_tweet_id):
-                    newest_tweet_id = tweet_id
+    # Results come newest first; fire commands are handled in the order posted
+    for thread_tweets in tweets_by_thread.values():
+        thread_tweets.sort(key=lambda tweet: int(tweet.id))
 
-                # Skip bot's own tweets
-                if BOT_USER_ID and str(tweet.author_id) == BOT_USER_ID:
-                    continue
+    return tweets_by_thread
 
-                author_id = str(tweet.author_id)
 
-                # Check if this is from one of the players
-                if author_id != game['player1_id'] and author_id != game['player2_id']:
-                    # Not a player in this game - skip
-                    continue
+def has_fire_command(game, tweets):
+    """
+    Check whether any of a thread's tweets looks like a player's fire command.
 
-                # Check if tweet contains a fire pattern
-                coordinate = parse_coordinate_from_text(tweet.text)
-                if not coordinate:
-                    # No coordinate found - not a fire command
-                    continue
+    Args:
+        game: The active game record from the database
+        tweets: Tweets found in the game's conversation
 
-                print(f"  Found fire command in tweet {tweet_id}: {coordinate}")
-                logger.info(f"Fire command detected in thread {thread_id}: {tweet.text}")
+    Returns:
+        bool: True if a player posted something with a coordinate in it
+    """
+    players = (game['player1_id'], game['player2_id'])
+    return any(
+        str(tweet.author_id) in players and parse_coordinate_from_text(tweet.text)
+        for tweet in tweets
+    )
 
-                # Refresh game data to ensure we have latest state
-                game_data = get_game_by_thread_id(thread_id)
-                if not game_data or game_data.get('game_state') != 'active':
-                    print(f"  Game {thread_id} is no longer active")
-                    break  # Stop processing this game
 
-                # Check if this tweet was already processed (prevents double-processing)
-                if is_already_processed(tweet_id):
-                    print(f"  Tweet {tweet_id} already processed - skipping")
-                    continue
+def process_game_thread(game, tweets, already_processed, game_data=None):
+    """
+    Process new replies in one game thread, handling any fire commands.
 
-                # TURN VALIDATION
-                current_turn_player_id = game_data['player1_id'] if game_data['turn'] == 'player1' else game_data['player2_id']
+    Args:
+        game: The active game record from the database
+        tweets: New tweets found in the game's conversation, oldest first
+        already_processed: Set of tweet IDs from the search that were processed before
+        game_data: Optional full game row (with boards), if the caller already loaded it
 
-                if author_id != current_turn_player_id:
-                    # Get the username of whose turn it actually is
-                    whose_turn_username = get_username_from_response(current_turn_player_id, response)
-                    # If we only got the ID back, make an API call to get the username
-                    if whose_turn_username == current_turn_player_id:
-                        whose_turn_username = get_username_by_id(current_turn_player_id)
-                    reply_text = f"⏳ Hold up! It's @{whose_turn_username}'s turn. You'll go next!"
-                    try:
-                        get_twitter_client().create_tweet(
-                            text=reply_text,
-                            in_reply_to_tweet_id=tweet.id
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to send turn rejection: {e}")
-                    print(f"  Rejected - not {author_id}'s turn (it's {whose_turn_username}'s turn)")
-                    # Mark as processed so we don't send duplicate rejection messages
-                    add_processed_tweet(tweet_id)
-                    continue
-
-                # Get usernames from expansions
-                author_username = get_username_from_response(tweet.author_id, response)
-                # If we only got the ID back, make an API call to get the username
-                if author_username == str(tweet.author_id):
-                    author_username = get_username_by_id(tweet.author_id)
-                opponent_id = game_data['player2_id'] if author_id == game_data['player1_id'] else game_data['player1_id']
-                opponent_username = get_username_from_response(opponent_id, response)
-                # If we only got the ID back, make an API call to get the username
-                if opponent_username == opponent_id:
-                    opponent_username = get_username_by_id(opponent_id)
-
-                # Mark tweet as processed BEFORE processing to prevent race conditions
-                add_processed_tweet(tweet_id)
-
-                # Process the fire command
-                try:
-                    success = process_fire_tweet(tweet, game_data, author_username, opponent_username)
-                    if success:
-                        print(f"  Successfully processed fire command")
-                except Exception as e:
-                    print(f"  Error processing fire command: {e}")
-                    logger.error(f"Error processing fire command in thread {thread_id}: {e}")
-
-            # Update last_checked_tweet_id for this game
-            if newest_tweet_id and newest_tweet_id != last_checked:
-                update_last_checked_tweet_id(thread_id, newest_tweet_id)
-                logger.info(f"Updated last_checked_tweet_id for {thread_id} to {newest_tweet_id}")
+    Returns:
+        bool: True if the thread had new tweets
+    """
+    thread_id = game['thread_id']
+    last_checked = game.get('last_checked_tweet_id')
+
+    # The batched search may return tweets this thread has already seen
+    if last_checked:
+        tweets = [tweet for tweet in tweets if int(tweet.id) > int(last_checked)]
+
+    if not tweets:
+        logger.debug("No new tweets in thread %s", thread_id)
+        return False
 
+    logger.info("Found %d new tweet(s) in thread %s", len(tweets), thread_id)
+
+    # Track the highest tweet ID we process
+    newest_tweet_id = last_checked
+
+    # The full game (with boards) is only needed once a fire command turns
+    # up; successful shots keep it up to date, so there's no SELECT per command
+
+    for tweet in tweets:
+        tweet_id = str(tweet.id)
+
+        # Update newest_tweet_id tracker
+        if not newest_tweet_id or int(tweet_id) > int(newest_tweet_id):
+            newest_tweet_id = tweet_id
+
+        # Skip bot's own tweets
+        if BOT_USER_ID and str(tweet.author_id) == BOT_USER_ID:
+            continue
+
+        author_id = str(tweet.author_id)
+
+        # Check if this is from one of the players
+        if author_id != game['player1_id'] and author_id != game['player2_id']:
+            # Not a player in this game - skip
+            continue
+
+        # Check if tweet contains a fire pattern
+        coordinate = parse_coordinate_from_text(tweet.text)
+        if not coordinate:
+            # No coordinate found - not a fire command
+            continue
+
+        logger.info("Fire command %s in tweet %s (thread %s)", coordinate, tweet_id, thread_id)
+        logger.debug("Fire command tweet text: %s", tweet.text)
+
+        # Load the game on the first fire command, or re-read it if a
+        # previous command left its state uncertain. The boards are left
+        # out here and only loaded below if the shot is in turn.
+        if game_data is None:
+            game_data = get_game_meta(thread_id)
+        if not game_data or game_data.get('game_state') != 'active':
+            logger.info("Game %s is no longer active", thread_id)
+            break  # Stop processing this game
+
+        # Claim the tweet BEFORE processing to prevent double-processing -
+        # checking and marking it is a single statement, so there's no race
+        if tweet_id in already_processed or not claim_processed_tweet(tweet_id):
+            logger.debug("Tweet %s already processed - skipping", tweet_id)
+            continue
+
+        # Usernames are stored with the game, so no API lookup is needed per turn
+        player1_username, player2_username = get_player_usernames(game_data)
+
+        # TURN VALIDATION
+        current_turn_player_id = game_data['player1_id'] if game_data['turn'] == 'player1' else game_data['player2_id']
+
+        if author_id != current_turn_player_id:
+            # Get the username of whose turn it actually is
+            whose_turn_username = player1_username if game_data['turn'] == 'player1' else player2_username
+            reply_text = f"⏳ Hold up! It's @{whose_turn_username}'s turn. You'll go next!"
+            try:
+                get_twitter_client().create_tweet(
+                    text=reply_text,
+                    in_reply_to_tweet_id=tweet.id
+                )
+            except Exception as e:
+                logger.error("Failed to send turn rejection: %s", e)
+            logger.info("Rejected - not %s's turn (it's %s's turn)", author_id, whose_turn_username)
+            continue
+
+        if author_id == game_data['player1_id']:
+            author_username, opponent_username = player1_username, player2_username
+        else:
+            author_username, opponent_username = player2_username, player1_username
+
+        # Process the fire command
+        try:
+            if 'player1_board' not in game_data:
+                boards = get_game_boards(thread_id)
+                if not boards:
+                    logger.info("Game %s no longer exists", thread_id)
+                    break
+                game_data.update(boards)
+            success = process_fire_tweet(tweet, game_data, author_username, opponent_username)
+            if success:
+                logger.info("Successfully processed fire command")
+            else:
+                game_data = None
+        except Exception as e:
+            game_data = None
+            logger.error("Error processing fire command in thread %s: %s", thread_id, e)
+
+    # Update last_checked_tweet_id for this game
+    if newest_tweet_id and newest_tweet_id != last_checked:
+        update_last_checked_tweet_id(thread_id, newest_tweet_id)
+        # Keep the cached game in step, since it may not be re-read next poll
+        game['last_checked_tweet_id'] = newest_tweet_id
+        logger.debug("Updated last_checked_tweet_id for %s to %s", thread_id, newest_tweet_id)
+
+    return True
+
+
+def monitor_active_games():
+    """
+    Monitor active game threads for fire commands WITHOUT requiring @mentions.
+
+    This function:
+    1. Gets all active games from the database
+    2. Searches the game conversations for new replies, several threads per API call
+    3. Looks for fire patterns (fire A1, A1, etc.)
+    4. Processes valid fire commands
+
+    This allows players to just reply "fire A1" without mentioning @battle_dinghy.
+
+    Returns:
+        bool: True if any game thread had new tweets
+    """
+    logger.debug("Monitoring active game threads for fire commands...")
+
+    # Get all active games
+    active_games = get_monitored_games()
+
+    if not active_games:
+        logger.debug("No active games to monitor")
+        return False
+
+    logger.info("Monitoring %d active game(s)", len(active_games))
+
+    found_new_tweets = False
+
+    # A batch shares one since_id, so threads without a usable checkpoint (new,
+    # or last checked before the search window) are batched apart from the
+    # rest, and the rest in checkpoint order, so one thread doesn't pull a
+    # whole batch back to an old since_id
+    unchecked_games = []
+    checked_games = []
+    for game in active_games:
+        if usable_since_id(game.get('last_checked_tweet_id')):
+            checked_games.append(game)
+        else:
+            unchecked_games.append(game)
+    checked_games.sort(key=lambda game: int(game['last_checked_tweet_id']))
+
+    batches = [
+        games[batch_start:batch_start + MAX_THREADS_PER_SEARCH]
+        for games in (unchecked_games, checked_games)
+        for batch_start in range(0, len(games), MAX_THREADS_PER_SEARCH)
+    ]
+
+    for batch in batches:
+        thread_ids = [game['thread_id'] for game in batch]
+
+        logger.debug("Checking threads %s", thread_ids)
+
+        try:
+            # Search for tweets in these conversations
+            # Note: Twitter API requires searching by conversation_id
+            tweets_by_thread = search_game_threads(batch)
         except Exception as e:
-            print(f"  Error monitoring thread {thread_id}: {e}")
-            logger.error(f"Error monitoring thread {thread_id}: {e}")
+            logger.error("Error searching threads %s: %s", thread_ids, e)
+            continue
+
+        # One lookup covers every tweet in the batch instead of one query per fire command
+        already_processed = get_already_processed(
+            tweet.id for tweets in tweets_by_thread.values() for tweet in tweets
+        )
+
+        # Load the full games for every thread with a fire command in one query
+        fire_thread_ids = [
+            game['thread_id'] for game in batch
+            if has_fire_command(game, tweets_by_thread[game['thread_id']])
+        ]
+        full_games = get_games_by_thread_ids(fire_thread_ids)
+
+        for game in batch:
+            try:
+                if process_game_thread(
+                    game,
+                    tweets_by_thread[game['thread_id']],
+                    already_processed,
+                    full_games.get(game['thread_id'])
+                ):
+                    found_new_tweets = True
+            except Exception as e:
+                logger.error("Error monitoring thread %s: %s", game['thread_id'], e)
+
+    return found_new_tweets
 
 
 def main_loop():
     """
     Main game loop that polls for both challenges and fire commands.
     """
-    print(f"Starting Battle Dinghy bot polling for {BOT_USERNAME}...")
-    logger.info(f"Battle Dinghy bot started, polling for {BOT_USERNAME}")
+    logger.info("Battle Dinghy bot started, polling for %s", BOT_USERNAME)
 
     # Track the last challenge tweet ID we've seen
-    last_challenge_tweet_id = None
+    # Loaded from the database so a restart doesn't re-scan old mentions
+    last_challenge_tweet_id = get_bot_state('last_challenge_tweet_id')
+    saved_challenge_tweet_id = last_challenge_tweet_id
 
-    # Counter for periodic cleanup (every ~60 polls = ~1 hour)
-    poll_count = 0
+    # Periodic cleanup is timed rather than counted, since the poll interval varies
+    last_cleanup_at = time.time()
 
-    while True:
-        poll_count += 1
+    # Seconds to wait after the current poll cycle
+    wait_seconds = POLL_INTERVAL_SECONDS
 
+    while True:
         # Periodic cleanup of old processed tweets from database (every hour)
-        if poll_count % 60 == 0:
+        if time.time() - last_cleanup_at >= CLEANUP_INTERVAL_SECONDS:
             logger.info("Running periodic cleanup of old processed tweets...")
             cleanup_old_processed_tweets(hours=24)
+            last_cleanup_at = time.time()
+
+        found_new_tweets = False
 
         try:
             # Check for new challenges
-            print("\nChecking for new challenges...")
+            logger.debug("Checking for new challenges...")
             # Search for any mention of the bot (we'll filter by keywords in code)
-            query = f"@{BOT_USERNAME}"
-            
-            # Debug: Show what we're searching for
-            print(f"DEBUG: Searching for: '{query}'")
-            logger.info(f"Searching Twitter for: '{query}'")
+            # Retweets and the bot's own tweets are dropped by Twitter, not in code,
+            # so they don't take up any of the max_results slots
+            query = f"@{BOT_USERNAME} -from:{BOT_USERNAME} -is:retweet"
+            logger.debug("Searching Twitter for: '%s'", query)
 
+            # Expanding the mentioned users returns the opponents along with
+            # the challengers, so looking up the opponent needs no extra call
             search_params = {
                 'query': query,
                 'max_results': 10,
-                'tweet_fields': ['author_id', 'created_at', 'conversation_id'],
-                'expansions': ['author_id'],
+                'tweet_fields': ['author_id', 'conversation_id'],
+                'expansions': ['author_id', 'entities.mentions.username'],
                 'user_fields': ['username']
             }
 
-            if last_challenge_tweet_id:
-                search_params['since_id'] = last_challenge_tweet_id
+            # A checkpoint older than the search window would make the request fail
+            since_id = usable_since_id(last_challenge_tweet_id)
+            if since_id:
+                search_params['since_id'] = since_id
 
             response = get_twitter_client().search_recent_tweets(**search_params)
-            
-            # Debug: Show what Twitter returned
-            if response.data:
-                print(f"DEBUG: Found {len(response.data)} tweet(s)")
-            else:
-                print(f"DEBUG: No tweets found. Response: {response}")
-                if response.errors:
-                    print(f"DEBUG: Errors: {response.errors}")
+
+            # Show what Twitter returned
+            logger.debug("Search found %d tweet(s)", len(response.data or []))
+            if response.errors:
+                logger.warning("Search errors: %s", response.errors)
 
             if response.data:
-                print(f"Found {len(response.data)} new challenge(s)")
+                found_new_tweets = True
+                logger.info("Found %d new mention(s) to check for challenges", len(response.data))
+
+                # Check the whole page against processed tweets in one lookup
+                already_processed = get_already_processed(tweet.id for tweet in response.data)
 
                 # Rate limit protection: only process 1 challenge per cycle
                 MAX_CHALLENGES_PER_CYCLE = 1
@@ -657,87 +1212,41 @@ def main_loop():
 
                     # Skip if this is from the bot itself
                     if BOT_USER_ID and str(tweet.author_id) == BOT_USER_ID:
-                        print(f"Skipping bot's own tweet {tweet.id}")
+                        logger.debug("Skipping bot's own tweet %s", tweet.id)
                         continue
 
                     # Skip if already processed (prevents reprocessing old challenges)
-                    if is_already_processed(tweet.id):
-                        print(f"Skipping already processed tweet {tweet.id}")
+                    if str(tweet.id) in already_processed:
+                        logger.debug("Skipping already processed tweet %s", tweet.id)
                         continue
 
                     # Rate limit protection: stop if we've processed enough this cycle
                     if challenges_processed >= MAX_CHALLENGES_PER_CYCLE:
-                        print(f"Rate limit protection: processed {challenges_processed} challenge(s), deferring rest to next cycle")
+                        logger.info("Rate limit protection: processed %d challenge(s), deferring rest to next cycle", challenges_processed)
                         break
 
                     # Natural language challenge detection with confidence scoring
-                    tweet_text_lower = tweet.text.lower()
-
-                    # Remove bot username to avoid false positives from keywords in username
-                    # e.g., @battle_dinghy contains "battle" but shouldn't count
-                    text_without_bot = tweet_text_lower.replace(f'@{BOT_USERNAME.lower()}', '')
+                    confidence_score = score_challenge_confidence(tweet.text)
 
-                    confidence_score = 0
-                    
-                    # Strong challenge indicators (3 points each)
-                    strong_keywords = ['play', 'playing', 'played', 'challenge', 'challenging', 'challenged', 
-                                      'battle', 'battling', 'fight', 'fighting', 'game', 'gaming', 
-                                      'match', 'versus', 'vs', 'against']
-                    for keyword in strong_keywords:
-                        if keyword in text_without_bot:  # Check text without bot username
-                            confidence_score += 3
-                            break  # Only count once per category
-                    
-                    # Invitation indicators (2 points each)
-                    invitation_keywords = ['wanna', 'wana', 'want', 'wants', 'lets', "let's", 
-                                          'ready', 'down', 'dare', 'bet', 'up for', 'fancy']
-                    for keyword in invitation_keywords:
-                        if keyword in text_without_bot:
-                            confidence_score += 2
-                            break
-                    
-                    # Challenge phrases (3 points)
-                    challenge_phrases = ['start game', 'new game', 'begin match', '1v1', 'one on one',
-                                        'you and me', 'with me', 'challenge you', 'i challenge',
-                                        'game of', 'play a game', 'to a game', 'battleship', 'battle dinghy']
-                    for phrase in challenge_phrases:
-                        if phrase in text_without_bot:
-                            confidence_score += 3
-                            break
-                    
-                    # Structural indicators (1 point each)
-                    mention_count = tweet_text_lower.count('@')
-                    if mention_count >= 2:  # Has opponent mention
-                        confidence_score += 1
-                    if '?' in tweet_text_lower:  # Question format (invitation)
-                        confidence_score += 1
-                    
-                    # Question starters (2 points)
-                    question_starters = ['who', 'anyone', 'anybody']
-                    first_word = tweet_text_lower.strip().split()[0] if tweet_text_lower.strip() else ''
-                    if first_word in question_starters:
-                        confidence_score += 2
-                    
                     # Log confidence for debugging
-                    logger.info(f"Tweet {tweet.id} challenge confidence: {confidence_score}")
+                    logger.debug("Tweet %s challenge confidence: %s", tweet.id, confidence_score)
                     
                     # Threshold: Need at least 3 points to be considered a challenge
                     if confidence_score < 3:
-                        print(f"Tweet {tweet.id} mentions bot but doesn't look like a challenge (score: {confidence_score}) - skipping")
-                        logger.info(f"Skipped tweet: '{tweet.text}' (confidence: {confidence_score})")
+                        logger.info("Tweet %s mentions bot but doesn't look like a challenge (score: %s) - skipping: '%s'",
+                                    tweet.id, confidence_score, tweet.text)
                         continue
                     
-                    print(f"Challenge detected! (confidence: {confidence_score})")
-                    
-                    print(f"Processing challenge tweet {tweet.id}")
+                    logger.info("Challenge detected in tweet %s (confidence: %s)", tweet.id, confidence_score)
 
                     challenger_id = str(tweet.author_id)
 
                     # Get challenger's username from expansions (no extra API call needed)
+                    # This also caches the mentioned users for the opponent lookup below
                     challenger_username = get_username_from_response(tweet.author_id, response)
 
                     tweet_text = tweet.text
-                    print(f"Challenge tweet text: {tweet_text}")
+                    logger.debug("Challenge tweet text: %s", tweet_text)
 
                     mentions = []
                     words = tweet_text.split()
@@ -750,7 +1259,7 @@ def main_loop():
                                 mentions.append(clean_username)
 
                     if not mentions:
-                        print(f"No opponent mentioned in tweet {tweet.id} - skipping")
+                        logger.info("No opponent mentioned in tweet %s - skipping", tweet.id)
                         # Reply to let user know they need to mention an opponent
                         try:
                             get_twitter_client().create_tweet(
@@ -762,14 +1271,14 @@ def main_loop():
                         continue
 
                     opponent_username = mentions[0]
-                    print(f"Found opponent mention: @{opponent_username}")
+                    logger.debug("Found opponent mention: @%s", opponent_username)
 
                     # OPPONENT VALIDATION FIX: Verify opponent exists before creating game
                     # This prevents broken games with invalid opponent IDs
                     try:
-                        opponent_user_response = get_twitter_client().get_user(username=opponent_username)
-                        if not opponent_user_response.data:
-                            print(f"Opponent @{opponent_username} not found")
+                        opponent_id = get_user_id_by_username(opponent_username)
+                        if not opponent_id:
+                            logger.info("Opponent @%s not found", opponent_username)
                             # Reply with error - DON'T create game
                             try:
                                 get_twitter_client().create_tweet(
@@ -779,10 +1288,8 @@ def main_loop():
                             except:
                                 pass
                             continue  # Skip game creation
-
-                        opponent_id = str(opponent_user_response.data.id)
                     except Exception as e:
-                        print(f"Error looking up opponent @{opponent_username}: {e}")
+                        logger.warning("Error looking up opponent @%s: %s", opponent_username, e)
                         # Reply with error - DON'T create game
                         try:
                             get_twitter_client().create_tweet(
@@ -795,7 +1302,7 @@ def main_loop():
 
                     # SELF-CHALLENGE VALIDATION: Block users from challenging themselves
                     if opponent_id == challenger_id:
-                        print(f"User {challenger_id} tried to challenge themselves")
+                        logger.info("User %s tried to challenge themselves", challenger_id)
                         try:
                             get_twitter_client().create_tweet(
                                 text="❌ You can't challenge yourself! Pick a friend to play against.",
@@ -807,7 +1314,7 @@ def main_loop():
 
                     # BOT-CHALLENGE VALIDATION: Block users from challenging the bot
                     if BOT_USER_ID and opponent_id == BOT_USER_ID:
-                        print(f"User {challenger_id} tried to challenge the bot")
+                        logger.info("User %s tried to challenge the bot", challenger_id)
                         try:
                             get_twitter_client().create_tweet(
                                 text="❌ You can't challenge me! I'm the referee, not a player! 🤖",
@@ -817,22 +1324,24 @@ def main_loop():
                             pass
                         continue  # Skip game creation
 
-                    print(f"Challenge: {challenger_username} vs {opponent_username}")
+                    logger.info("Challenge: %s vs %s", challenger_username, opponent_username)
 
                     board1 = create_new_board()
                     board2 = create_new_board()
 
-                    thread_id = str(tweet.conversation_id) if hasattr(tweet, 'conversation_id') else str(tweet.id)
+                    thread_id = str(tweet.conversation_id or tweet.id)
 
                     # Create game with error handling
                     try:
-                        game_id = create_game(challenger_id, opponent_id, board1, board2, thread_id)
-                        print(f"Created game with thread_id {game_id}")
-                        logger.info(f"Game created: thread_id={game_id}, challenger={challenger_username}, opponent={opponent_username}")
+                        # The INSERT returns the new row, so there's no need to read it back
+                        game_data = create_game(
+                            challenger_id, opponent_id, board1, board2, thread_id,
+                            challenger_username, opponent_username
+                        )
+                        logger.info("Game created: thread_id=%s, challenger=%s, opponent=%s", thread_id, challenger_username, opponent_username)
                     except Exception as e:
                         error_msg = str(e)
-                        print(f"Failed to create game: {error_msg}")
-                        logger.error(f"Failed to create game: {error_msg}")
+                        logger.error("Failed to create game: %s", error_msg)
                         
                         # Reply to user with helpful error message
                         if "Could not connect to database" in error_msg or "getaddrinfo" in error_msg:
@@ -861,22 +1370,8 @@ def main_loop():
                             pass  # Don't fail if reply doesn't work
                         continue  # Skip to next tweet
 
-                    # Verify game was created successfully
-                    game_data = get_game_by_thread_id(thread_id)
-                    if not game_data:
-                        print(f"ERROR: Game was not created in database for thread {thread_id}")
-                        logger.error(f"Game creation verification failed for thread {thread_id}")
-                        try:
-                            get_twitter_client().create_tweet(
-                                text="❌ Error creating game. Please try again!",
-                                in_reply_to_tweet_id=tweet.id
-                            )
-                        except:
-                            pass
-                        continue
-
-                    # Get the post number for this bot tweet
-                    post_number = increment_bot_post_count(thread_id)
+                    # The opening post is counted when the game is created
+                    post_number = game_data['bot_post_count']
                     game_number = game_data.get('game_number', 1)
 
                     # Determine who goes first based on random selection in database
@@ -894,23 +1389,16 @@ def main_loop():
 
                     # Generate the starting board image
                     # Show the DEFENDER's fleet (whose ships are being targeted)
-                    blank_board = [[0 for _ in range(5)] for _ in range(5)]  # 5x5 grid
-                    # Initial ship status - all ships at full health (no hits, not sunk)
-                    initial_ship_status = {
-                        'giant': {'hits': 0, 'sunk': False, 'size': 3},
-                        'average': {'hits': 0, 'sunk': False, 'size': 2},
-                        'tiny': {'hits': 0, 'sunk': False, 'size': 1}
-                    }
-                    image_filename = generate_board_image(
-                        blank_board,
+                    board_image = generate_board_image(
+                        BLANK_BOARD,
                         f"@{first_player_username}",  # Who will be shooting (attacker)
                         f"@{defender_username}",      # Whose fleet this is (defender)
                         target_theme,
-                        initial_ship_status  # Show ship tracker on starting board
+                        INITIAL_SHIP_STATUS  # Show ship tracker on starting board
                     )
 
                     # Log game creation with first player info
-                    logger.info(f"Game created: {thread_id}, {challenger_username} vs {opponent_username}, first player: {first_player_username}")
+                    logger.info("Game started: %s, %s vs %s, first player: %s", thread_id, challenger_username, opponent_username, first_player_username)
 
                     reply_text = (
                         f"{post_number}/ ⚔️ Game #{game_number} has begun! ⚔️\n\n"
@@ -923,31 +1411,27 @@ def main_loop():
                     )
 
                     # Upload image to Twitter using v1.1 API
-                    import tweepy
-                    auth = tweepy.OAuth1UserHandler(
-                        os.getenv("X_API_KEY"),
-                        os.getenv("X_API_SECRET"),
-                        os.getenv("X_ACCESS_TOKEN"),
-                        os.getenv("X_ACCESS_TOKEN_SECRET")
-                    )
-                    api = tweepy.API(auth)
-                    media = api.media_upload(image_filename)
+                    media_id = upload_media(board_image)
 
                     reply = get_twitter_client().create_tweet(
                         text=reply_text,
                         in_reply_to_tweet_id=tweet.id,
-                        media_ids=[media.media_id]
+                        media_ids=[media_id]
                     )
 
-                    print(f"Posted reply tweet {reply.data['id']}")
-                    print("Game started successfully!")
+                    logger.info("Game started successfully, posted reply tweet %s", reply.data['id'])
 
                     # Mark challenge tweet as processed and increment counter
                     add_processed_tweet(tweet.id)
                     challenges_processed += 1
 
             else:
-                print("No new challenges found")
+                logger.debug("No new challenges found")
+
+            # Persist the checkpoint only when it moved
+            if last_challenge_tweet_id and str(last_challenge_tweet_id) != saved_challenge_tweet_id:
+                saved_challenge_tweet_id = str(last_challenge_tweet_id)
+                set_bot_state('last_challenge_tweet_id', saved_challenge_tweet_id)
 
             # =================================================================
             # PART 2: Monitor active game threads for fire commands
@@ -955,17 +1439,29 @@ def main_loop():
             # This is the ONLY way to detect fire commands
             # Players reply "fire A1" (or just "A1") in the game thread
             # No @mention needed - we monitor all active game threads
-            monitor_active_games()
+            if monitor_active_games():
+                found_new_tweets = True
 
         except Exception as e:
-            print(f"Error in main loop: {e}")
-            logger.error(f"Error in main loop: {e}")
-            print("Continuing to next poll cycle...")
+            logger.error("Error in main loop: %s - continuing to next poll cycle", e)
 
-        # Wait 60 seconds before polling again
-        print("\nWaiting 60 seconds before next poll...")
-        time.sleep(60)
+        # Wait before polling again: briefly after activity, backing off
+        # towards the full interval while things are quiet
+        if found_new_tweets:
+            wait_seconds = ACTIVE_POLL_INTERVAL_SECONDS
+        else:
+            wait_seconds = min(POLL_INTERVAL_SECONDS, wait_seconds * 2)
+        logger.debug("Waiting %d seconds before next poll...", wait_seconds)
+        time.sleep(wait_seconds)
 
 
 if __name__ == "__main__":
+    configure_logging()
+
+    # Create/upgrade the schema once at startup, rather than whenever db is imported
+    try:
+        init_db()
+    except Exception as e:
+        logger.error("Error initializing database: %s", e)
+
     main_loop()
@@ -1,4 +1,5 @@
 import random
+from collections import Counter
 
 # Grid size constant
 GRID_SIZE = 5
@@ -11,6 +12,38 @@ FLEET_CONFIG = {
     'Tiny Dinghy': 1
 }
 
+# Ship IDs stored on the board: ship_name -> ID (ID = size for simplicity)
+SHIP_IDS = {
+    'Giant Dinghy': 3,
+    'Average Dinghy': 2,
+    'Tiny Dinghy': 1
+}
+
+# Reverse lookup used when a shot hits: ID -> ship_name
+SHIP_NAMES_BY_ID = {ship_id: ship_name for ship_name, ship_id in SHIP_IDS.items()}
+
+# Coordinate -> (row, col) for every cell, e.g. "A1" -> (0, 0). Both letter
+# cases are included since coordinates parsed from tweets are lowercase.
+COORD_MAP = {
+    f"{letter}{number}": (row, number - 1)
+    for row, upper in enumerate("ABCDE")
+    for letter in (upper, upper.lower())
+    for number in range(1, GRID_SIZE + 1)
+}
+
+# Every way to lay each ship size on the grid: size -> list of cell tuples.
+# Horizontal placements first, then vertical.
+SHIP_PLACEMENTS = {
+    size: [
+        tuple((row, col + i) for i in range(size))
+        for row in range(GRID_SIZE) for col in range(GRID_SIZE - size + 1)
+    ] + [
+        tuple((row + i, col) for i in range(size))
+        for row in range(GRID_SIZE - size + 1) for col in range(GRID_SIZE)
+    ]
+    for size in set(FLEET_CONFIG.values())
+}
+
 
 def create_new_board():
     """
@@ -23,115 +56,92 @@ def create_new_board():
     # Create empty 5x5 grid filled with 0s (water)
     board = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
 
-    # Assign ship IDs based on their size (ID = size for simplicity)
-    ship_ids = {
-        'Giant Dinghy': 3,
-        'Average Dinghy': 2,
-        'Tiny Dinghy': 1
-    }
-
-    # Try to place each ship
+    # Place each ship at a random free spot - every placement that doesn't
+    # overlap an already placed ship is equally likely
     for ship_name, ship_size in FLEET_CONFIG.items():
-        ship_id = ship_ids[ship_name]
-        placed = False
-        attempts = 0
-        max_attempts = 100  # Prevent infinite loop
-
-        while not placed and attempts < max_attempts:
-            attempts += 1
-
-            # Random orientation: horizontal or vertical
-            orientation = random.choice(['horizontal', 'vertical'])
-
-            if orientation == 'horizontal':
-                # Random starting position for horizontal ship
-                row = random.randint(0, GRID_SIZE - 1)
-                col = random.randint(0, GRID_SIZE - ship_size)
-
-                # Check if placement is valid (no overlaps)
-                valid = True
-                for c in range(col, col + ship_size):
-                    if board[row][c] != 0:
-                        valid = False
-                        break
-
-                # Place the ship if valid
-                if valid:
-                    for c in range(col, col + ship_size):
-                        board[row][c] = ship_id
-                    placed = True
-
-            else:  # vertical
-                # Random starting position for vertical ship
-                row = random.randint(0, GRID_SIZE - ship_size)
-                col = random.randint(0, GRID_SIZE - 1)
-
-                # Check if placement is valid (no overlaps)
-                valid = True
-                for r in range(row, row + ship_size):
-                    if board[r][col] != 0:
-                        valid = False
-                        break
-
-                # Place the ship if valid
-                if valid:
-                    for r in range(row, row + ship_size):
-                        board[r][col] = ship_id
-                    placed = True
-
-        if not placed:
-            # If we couldn't place a ship after max attempts, start over
+        ship_id = SHIP_IDS[ship_name]
+        free_placements = [
+            cells for cells in SHIP_PLACEMENTS[ship_size]
+            if all(board[row][col] == 0 for row, col in cells)
+        ]
+
+        if not free_placements:
+            # No room left for this ship - start over
             return create_new_board()
 
+        for row, col in random.choice(free_placements):
+            board[row][col] = ship_id
+
     return board
 
 
-def process_shot(coordinate, secret_board, hits_board):
+def _parse_coordinate(coordinate):
     """
-    Process a shot at the given coordinate.
+    Parse a coordinate that isn't a plain COORD_MAP key, e.g. " a1 " or "A01".
 
     Args:
-        coordinate: String coordinate like "A1", "C3", etc.
-        secret_board: The opponent's secret ship board (5x5 grid)
-        hits_board: The current player's hits tracking board (5x5 grid)
+        coordinate: String coordinate
 
     Returns:
-        tuple: (result_message, updated_hits_board, ship_name_if_hit)
-               result_message is a string like "MISS" or "HIT" or "SUNK"
-               updated_hits_board is the modified hits board
-               ship_name_if_hit is the ship name if hit, None otherwise
+        tuple: (row, col) 0-indexed, or None if it isn't a cell A1-E5
     """
-    # Input validation and sanitization
-    if not isinstance(coordinate, str):
-        return ("INVALID", hits_board, None)
-
     # Sanitize input - remove potentially dangerous characters
     coordinate = ''.join(c for c in coordinate if c.isalnum() or c.isspace())
     coordinate = coordinate.strip().upper()
 
     # Length check to prevent buffer overflow attempts
     if len(coordinate) > 10:
-        return ("INVALID", hits_board, None)
+        return None
 
     if len(coordinate) < 2:
-        return ("INVALID", hits_board, None)
+        return None
 
     # Parse the coordinate (e.g., "A1" -> row=0, col=0)
     row_letter = coordinate[0]
     try:
         col_number = int(coordinate[1:])
     except ValueError:
-        return ("INVALID", hits_board, None)
+        return None
 
     # Validate row (A-E) and column (1-5)
     if row_letter < 'A' or row_letter > 'E':
-        return ("INVALID", hits_board, None)
+        return None
     if col_number < 1 or col_number > 5:
-        return ("INVALID", hits_board, None)
+        return None
 
     # Convert to 0-indexed grid coordinates
-    row = ord(row_letter) - ord('A')
-    col = col_number - 1
+    return (ord(row_letter) - ord('A'), col_number - 1)
+
+
+def process_shot(coordinate, secret_board, hits_board):
+    """
+    Process a shot at the given coordinate.
+
+    Args:
+        coordinate: String coordinate like "A1", "C3", etc.
+        secret_board: The opponent's secret ship board (5x5 grid)
+        hits_board: The current player's hits tracking board (5x5 grid)
+
+    Returns:
+        tuple: (result_message, updated_hits_board, ship_name_if_hit)
+               result_message is a string like "MISS" or "HIT" or "SUNK"
+               updated_hits_board is the modified hits board
+               ship_name_if_hit is the ship name if hit, None otherwise
+    """
+    # Input validation and sanitization
+    if not isinstance(coordinate, str):
+        return ("INVALID", hits_board, None)
+
+    # Well-formed coordinates ("A1", "a1") resolve with a single lookup;
+    # anything else goes through the full sanitize-and-parse path
+    position = COORD_MAP.get(coordinate)
+    if position is None:
+        position = _parse_coordinate(coordinate)
+
+    if position is None:
+        return ("INVALID", hits_board, None)
+
+    row, col = position
 
     # Check if this coordinate was already fired upon
     # Values: 0=water, 1-3=ships, 9=miss, 11-13=hit ships
@@ -152,27 +162,12 @@ def process_shot(coordinate, secret_board, hits_board):
         hits_board[row][col] = 10 + ship_id  # Mark as HIT ship (preserves which ship)
 
         # Determine which ship was hit
-        ship_name = None
-        for name, sid in [('Giant Dinghy', 3), ('Average Dinghy', 2), ('Tiny Dinghy', 1)]:
-            if sid == ship_id:
-                ship_name = name
-                break
-
-        # Check if the ship is sunk by counting all positions of this ship
-        ship_positions = []
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                # Find ship by checking both unhit (1-3) and hit (11-13) positions
-                board_val = hits_board[r][c]
-                if board_val == ship_id or board_val == (10 + ship_id):
-                    ship_positions.append((r, c))
-
-        # Check if all positions of this ship are hit (value = 10 + ship_id)
-        all_hit = True
-        for r, c in ship_positions:
-            if hits_board[r][c] != (10 + ship_id):  # Not marked as hit yet
-                all_hit = False
-                break
+        ship_name = SHIP_NAMES_BY_ID.get(ship_id)
+
+        # The ship is sunk once none of its segments is still unhit (value = ship_id).
+        # Only this ship's cells can hold ship_id, so a membership test per row is
+        # enough - no need to visit every cell in Python.
+        all_hit = not any(ship_id in board_row for board_row in hits_board)
 
         if all_hit:
             # Ship is sunk
@@ -208,30 +203,12 @@ def get_ships_remaining(board):
         dict: {'Giant Dinghy': bool, 'Average Dinghy': bool, 'Tiny Dinghy': bool, 'total': int}
               True means ship is still afloat, False means sunk
     """
-    ships_status = {
-        'Giant Dinghy': False,
-        'Average Dinghy': False,
-        'Tiny Dinghy': False
-    }
+    # A ship is afloat if ANY segment is NOT hit (still has value ship_id, not 10+ship_id),
+    # so one pass collecting the unhit ship IDs covers every ship
+    afloat_ids = {cell for row in board for cell in row if cell in SHIP_NAMES_BY_ID}
 
-    # Check each ship type
-    for ship_name, ship_id in [('Giant Dinghy', 3), ('Average Dinghy', 2), ('Tiny Dinghy', 1)]:
-        # Find all positions of this ship (both unhit and hit)
-        ship_positions = []
-        for r in range(GRID_SIZE):
-            for c in range(GRID_SIZE):
-                cell_val = board[r][c]
-                # Ship exists if cell is ship_id (unhit) or 10+ship_id (hit)
-                if cell_val == ship_id or cell_val == (10 + ship_id):
-                    ship_positions.append((r, c))
-
-        # If ship exists on board, check if it's still afloat
-        if ship_positions:
-            # Afloat if ANY position is NOT hit (still has value ship_id, not 10+ship_id)
-            afloat = any(board[r][c] == ship_id for r, c in ship_positions)
-            ships_status[ship_name] = afloat
-
-    ships_status['total'] = sum(1 for status in [ships_status['Giant Dinghy'], ships_status['Average Dinghy'], ships_status['Tiny Dinghy']] if status)
+    ships_status = {ship_name: ship_id in afloat_ids for ship_name, ship_id in SHIP_IDS.items()}
+    ships_status['total'] = len(afloat_ids)
     return ships_status
 
 
@@ -252,6 +229,20 @@ def get_detailed_ship_status(board):
             'tiny': {'hits': 0-1, 'sunk': bool, 'size': 1}
         }
     """
+    # Count every cell value in one pass instead of rescanning the board per ship
+    return _ship_status_from_counts(Counter(cell for row in board for cell in row))
+
+
+def _ship_status_from_counts(cell_counts):
+    """
+    Build get_detailed_ship_status()'s result from a board's cell value counts.
+
+    Args:
+        cell_counts: Counter of cell value -> number of cells with that value
+
+    Returns:
+        dict: Same as get_detailed_ship_status()
+    """
     # Ship definitions: (display_key, ship_id, size)
     ships = [
         ('giant', 3, 3),    # Giant Dinghy: id=3, size=3
@@ -262,15 +253,8 @@ def get_detailed_ship_status(board):
     result = {}
 
     for key, ship_id, size in ships:
-        unhit_count = 0
-        hit_count = 0
-
-        for row in board:
-            for cell in row:
-                if cell == ship_id:  # Unhit ship segment
-                    unhit_count += 1
-                elif cell == (10 + ship_id):  # Hit ship segment
-                    hit_count += 1
+        unhit_count = cell_counts[ship_id]  # Unhit ship segments
+        hit_count = cell_counts[10 + ship_id]  # Hit ship segments
 
         # Ship is sunk if all segments are hit (no unhit segments remain)
         is_sunk = (unhit_count == 0 and hit_count > 0)
@@ -307,3 +291,29 @@ def count_hits_and_misses(board):
                 misses += 1
 
     return (hits, misses)
+
+
+def summarize_board(board):
+    """
+    Get a board's ships remaining, hit/miss counts and detailed ship status
+    in a single pass, instead of one pass per get_ships_remaining(),
+    count_hits_and_misses() and get_detailed_ship_status() call.
+
+    Args:
+        board: 5x5 grid with ship positions and hit/miss markers
+
+    Returns:
+        tuple: (ships_remaining, hits, misses, ship_status) - the same values
+               the three functions above return
+    """
+    cell_counts = Counter(cell for row in board for cell in row)
+
+    ships_remaining = {
+        ship_name: cell_counts[ship_id] > 0 for ship_name, ship_id in SHIP_IDS.items()
+    }
+    ships_remaining['total'] = sum(ships_remaining.values())
+
+    hits = sum(cell_counts[10 + ship_id] for ship_id in SHIP_NAMES_BY_ID)
+    misses = cell_counts[9]
+
+    return ships_remaining, hits, misses, _ship_status_from_counts(cell_counts)
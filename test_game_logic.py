@@ -14,6 +14,8 @@ from game_logic import (
     copy_board,
     get_ships_remaining,
     count_hits_and_misses,
+    get_detailed_ship_status,
+    summarize_board,
     FLEET_CONFIG
 )
 
@@ -206,5 +208,71 @@ class TestCoordinateParsing(unittest.TestCase):
             hits = updated_hits
 
 
+class TestShipStatus(unittest.TestCase):
+    """Test ship status on the 5x5 board (0=water, 1-3=ships, 9=miss, 11-13=hit ships)."""
+
+    def setUp(self):
+        """Place Giant (3) on row A, Average (2) on row B and Tiny (1) on row C."""
+        self.board = [[0] * 5 for _ in range(5)]
+        self.board[0][0:3] = [3, 3, 3]
+        self.board[1][0:2] = [2, 2]
+        self.board[2][0] = 1
+
+    def test_ships_remaining_after_partial_and_full_hits(self):
+        """Test that a hit ship stays afloat until every segment is hit."""
+        self.board[0][0] = 13  # Giant hit once
+        self.board[2][0] = 11  # Tiny sunk
+
+        ships = get_ships_remaining(self.board)
+
+        self.assertEqual(ships['total'], 2)
+        self.assertTrue(ships['Giant Dinghy'])
+        self.assertTrue(ships['Average Dinghy'])
+        self.assertFalse(ships['Tiny Dinghy'])
+
+    def test_detailed_ship_status_counts_hits(self):
+        """Test per-ship hit counts and sunk flags."""
+        self.board[1][0] = 12
+        self.board[1][1] = 12  # Average sunk
+        self.board[0][2] = 13  # Giant hit once
+
+        status = get_detailed_ship_status(self.board)
+
+        self.assertEqual(status['giant'], {'hits': 1, 'sunk': False, 'size': 3})
+        self.assertEqual(status['average'], {'hits': 2, 'sunk': True, 'size': 2})
+        self.assertEqual(status['tiny'], {'hits': 0, 'sunk': False, 'size': 1})
+
+    def test_process_shot_sinks_on_last_segment(self):
+        """Test that only the last segment of a ship reports SUNK."""
+        result, _, ship_name = process_shot("A1", self.board, self.board)
+        self.assertEqual((result, ship_name), ("HIT", "Giant Dinghy"))
+
+        process_shot("A2", self.board, self.board)
+        result, _, ship_name = process_shot("A3", self.board, self.board)
+        self.assertEqual((result, ship_name), ("SUNK", "Giant Dinghy"))
+
+    def test_process_shot_accepts_sanitized_coordinates(self):
+        """Test the coordinate forms accepted besides plain "A1"/"a1"."""
+        for coordinate in ["A 1", "A01", " a1 ", "A1!", "b\t2"]:
+            result, _, _ = process_shot(coordinate, self.board, [row[:] for row in self.board])
+            self.assertIn(result, ("HIT", "SUNK"), coordinate)
+
+        for coordinate in ["A6", "F1", "1A", "A", "AA", "A1B", "A 0"]:
+            result, _, _ = process_shot(coordinate, self.board, [row[:] for row in self.board])
+            self.assertEqual(result, "INVALID", coordinate)
+
+    def test_summarize_board_matches_individual_functions(self):
+        """Test that the one-pass summary agrees with the separate status functions."""
+        self.board[0][1] = 13  # Giant hit once
+        self.board[2][0] = 11  # Tiny sunk
+        self.board[4][4] = 9   # Miss
+
+        ships_remaining, hits, misses, ship_status = summarize_board(self.board)
+
+        self.assertEqual(ships_remaining, get_ships_remaining(self.board))
+        self.assertEqual((hits, misses), count_hits_and_misses(self.board))
+        self.assertEqual(ship_status, get_detailed_ship_status(self.board))
+
+
 if __name__ == '__main__':
     unittest.main()
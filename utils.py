@@ -6,6 +6,7 @@ database diagnostics, and connection testing.
 """
 
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from supabase import create_client
 import tweepy
@@ -44,6 +45,24 @@ def check_environment_variables():
         return True, [], message
 
 
+@lru_cache(maxsize=1)
+def get_supabase_client(supabase_url, supabase_key):
+    """
+    Get a Supabase client, created once and reused.
+
+    The diagnostics run several checks in a row - sharing one client keeps
+    its HTTP connection (and TLS session) open between them.
+
+    Args:
+        supabase_url: Supabase project URL
+        supabase_key: Supabase API key
+
+    Returns:
+        Client: The Supabase client
+    """
+    return create_client(supabase_url, supabase_key)
+
+
 def test_supabase_connection():
     """
     Test connection to Supabase database.
@@ -60,12 +79,12 @@ def test_supabase_connection():
         return False, "Missing Supabase credentials", None
 
     try:
-        supabase = create_client(supabase_url, supabase_key)
+        supabase = get_supabase_client(supabase_url, supabase_key)
 
-        # Try to query games table
-        response = supabase.table('games').select('*').limit(1).execute()
+        # Try to query games table - count server-side without fetching any rows
+        response = supabase.table('games').select('id', count='exact', head=True).execute()
 
-        message = f"[OK] Supabase connection successful! Found {len(response.data)} game(s)"
+        message = f"[OK] Supabase connection successful! Found {response.count} game(s)"
         return True, message, None
 
     except httpx.ConnectError as e:
@@ -146,7 +165,7 @@ def check_database_schema():
         return False, "Missing Supabase credentials", [], None
 
     try:
-        supabase = create_client(supabase_url, supabase_key)
+        supabase = get_supabase_client(supabase_url, supabase_key)
 
         # Try to fetch one record to see column structure
         response = supabase.table('games').select('*').limit(1).execute()